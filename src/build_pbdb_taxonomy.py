@@ -0,0 +1,370 @@
+"""
+Build the local PBDB taxonomy table used by query_pbdb_local.
+
+Reads a PBDB taxa export and, optionally, a references export (JSON or CSV
+files as downloaded from the PBDB data service, in either the compact or
+the pbdb vocabulary) and writes
+data/pbdb_essential_taxonomy_with_refs.parquet. The output is sorted by
+lowercase taxon name, carries precomputed name_key, year and author
+columns, and is written in small row groups with min/max statistics so
+that readers can skip row groups when filtering by name. Repetitive
+string columns such as references are dictionary-encoded by the polars
+parquet writer.
+
+With --update, rows from a newer export replace existing rows with the
+same taxon identifier (or, without identifiers, the same name) and new
+taxa are added, without re-reading the original exports.
+
+Usage:
+
+    uv run python build_pbdb_taxonomy.py --taxa taxa.json \
+        --references refs.json
+    uv run python build_pbdb_taxonomy.py --taxa new_taxa.csv \
+        --references new_refs.csv --update
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+import polars as pl
+
+from config_loader import NOT_AVAILABLE
+from pbdb_table import (
+    PBDB_FILE,
+    pbdb_author_expr,
+    pbdb_name_key_expr,
+    pbdb_year_expr,
+)
+
+# rows per row group; small groups make name filters skip more data
+DEFAULT_ROW_GROUP_SIZE = 16_384
+
+# accepted export field names for each output column, compact vocabulary
+# first; the first match found in a file is used
+TAXA_FIELDS = {
+    "oid": ["oid", "taxon_no", "orig_no"],
+    "nam": ["nam", "taxon_name"],
+    "att": ["att", "taxon_attr"],
+    "rid": ["rid", "reference_no"],
+    "ref": ["ref", "formatted", "reference"],
+    "doi": ["doi"],
+}
+REFERENCE_FIELDS = {
+    "rid": ["oid", "reference_no", "rid"],
+    "ref": ["ref", "formatted", "reference", "ref_formatted"],
+    "doi": ["doi", "r_doi"],
+}
+
+# columns of the output table, in order
+OUTPUT_COLUMNS = [
+    "oid",
+    "nam",
+    "att",
+    "rid",
+    "ref",
+    "doi",
+    "name_key",
+    "year",
+    "author",
+]
+
+
+def read_export(path: Path) -> pl.DataFrame:
+    """
+    Read a PBDB export file with every field as a string.
+
+    Parameters
+    ----------
+    path : Path
+        JSON (with a "records" list) or CSV export.
+
+    Returns
+    -------
+    pl.DataFrame
+        Export records.
+    """
+    if path.suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        records = data.get("records", []) if isinstance(data, dict) else data
+        df = pl.DataFrame(records, infer_schema_length=None)
+        return df.select(pl.all().cast(pl.Utf8))
+
+    return pl.read_csv(path, infer_schema=False)
+
+
+def select_fields(
+    df: pl.DataFrame, fields: dict[str, list[str]]
+) -> pl.DataFrame:
+    """
+    Rename export fields to output column names.
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        Export records.
+    fields : Dict[str, List[str]]
+        Accepted field names for each output column.
+
+    Returns
+    -------
+    pl.DataFrame
+        Frame with one column per output column found in the export.
+    """
+    columns = []
+    for column, candidates in fields.items():
+        for candidate in candidates:
+            if candidate in df.columns:
+                columns.append(pl.col(candidate).alias(column))
+                break
+    return df.select(columns)
+
+
+def strip_id_prefix(column: str) -> pl.Expr:
+    """
+    Remove PBDB identifier prefixes such as "txn:" or "ref:".
+
+    Parameters
+    ----------
+    column : str
+        Identifier column name.
+
+    Returns
+    -------
+    pl.Expr
+        Bare identifiers.
+    """
+    return pl.col(column).str.replace(r"^[a-z]{3}:", "")
+
+
+def build_table(
+    taxa_path: Path, references_path: Path | None = None
+) -> pl.DataFrame:
+    """
+    Build the query-optimized taxonomy table from export files.
+
+    Parameters
+    ----------
+    taxa_path : Path
+        PBDB taxa export.
+    references_path : Path
+        Optional PBDB references export, joined on reference number to
+        fill in full references and DOIs.
+
+    Returns
+    -------
+    pl.DataFrame
+        Taxonomy table sorted by name_key.
+    """
+    taxa = select_fields(read_export(taxa_path), TAXA_FIELDS)
+    if "nam" not in taxa.columns:
+        raise ValueError(f"No taxon name field found in {taxa_path}")
+
+    if references_path is not None and "rid" in taxa.columns:
+        references = select_fields(
+            read_export(references_path), REFERENCE_FIELDS
+        )
+        if "rid" not in references.columns:
+            raise ValueError(
+                f"No reference number field found in {references_path}"
+            )
+        references = references.with_columns(strip_id_prefix("rid")).unique(
+            subset="rid", keep="first"
+        )
+        taxa = taxa.with_columns(strip_id_prefix("rid")).join(
+            references, on="rid", how="left", suffix="_reference"
+        )
+
+        # prefer values from the references export
+        for column in ["ref", "doi"]:
+            joined = f"{column}_reference"
+            if joined in taxa.columns:
+                if column in taxa.columns:
+                    taxa = taxa.with_columns(
+                        pl.coalesce(joined, column).alias(column)
+                    )
+                else:
+                    taxa = taxa.with_columns(pl.col(joined).alias(column))
+
+    for column in ["oid", "att", "rid", "ref", "doi"]:
+        if column not in taxa.columns:
+            taxa = taxa.with_columns(pl.lit(None, pl.Utf8).alias(column))
+
+    taxa = taxa.with_columns(
+        strip_id_prefix("oid"),
+        strip_id_prefix("rid"),
+        pl.col("att").fill_null(NOT_AVAILABLE),
+        pl.col("ref").fill_null(NOT_AVAILABLE),
+    )
+    return finalize_table(taxa.filter(pl.col("nam").is_not_null()))
+
+
+def finalize_table(taxa: pl.DataFrame) -> pl.DataFrame:
+    """
+    Add precomputed lookup columns and sort by name.
+
+    Parameters
+    ----------
+    taxa : pl.DataFrame
+        Taxonomy rows with oid, nam, att, rid, ref and doi columns.
+
+    Returns
+    -------
+    pl.DataFrame
+        Table with OUTPUT_COLUMNS, sorted by name_key. Rows sharing a name
+        keep their export order, so lookups still return the first one.
+    """
+    att = pl.col("att")
+    ref = pl.col("ref")
+    return (
+        taxa.with_columns(
+            pl.col("nam").str.to_lowercase().alias("name_key"),
+            pbdb_year_expr(att).alias("year"),
+            pbdb_author_expr(att, ref).alias("author"),
+        )
+        .select(OUTPUT_COLUMNS)
+        .sort("name_key", maintain_order=True)
+    )
+
+
+def update_table(existing: pl.DataFrame, update: pl.DataFrame) -> pl.DataFrame:
+    """
+    Merge rows from a newer export into an existing table.
+
+    Rows of the newer export that have no reference keep the reference
+    number, reference and DOI of the row they replace.
+
+    Parameters
+    ----------
+    existing : pl.DataFrame
+        Current taxonomy table.
+    update : pl.DataFrame
+        Table built from the newer export.
+
+    Returns
+    -------
+    pl.DataFrame
+        Merged table sorted by name_key.
+    """
+    # match rows on taxon identifier where both sides have one
+    if "oid" in existing.columns and update["oid"].null_count() == 0:
+        key = "oid"
+    else:
+        key = "name_key"
+        if "name_key" not in existing.columns:
+            existing = existing.with_columns(
+                pbdb_name_key_expr(existing).alias("name_key")
+            )
+
+    for column in ["oid", "rid", "doi"]:
+        if column not in existing.columns:
+            existing = existing.with_columns(
+                pl.lit(None, pl.Utf8).alias(column)
+            )
+
+    # an export without references (e.g. taxa only) keeps the existing ones
+    previous = existing.select(
+        key,
+        pl.col("rid").alias("rid_existing"),
+        pl.col("ref").alias("ref_existing"),
+        pl.col("doi").alias("doi_existing"),
+    ).unique(subset=key, keep="first", maintain_order=True)
+    no_reference = pl.col("ref").is_null() | (pl.col("ref") == NOT_AVAILABLE)
+    update = update.join(previous, on=key, how="left").with_columns(
+        pl.coalesce("rid", "rid_existing").alias("rid"),
+        pl.when(no_reference)
+        .then(pl.coalesce("ref_existing", "ref"))
+        .otherwise(pl.col("ref"))
+        .alias("ref"),
+        pl.when(no_reference)
+        .then(pl.coalesce("doi_existing", "doi"))
+        .otherwise(pl.col("doi"))
+        .alias("doi"),
+    )
+
+    columns = ["oid", "nam", "att", "rid", "ref", "doi"]
+    kept = existing.join(update.select(key), on=key, how="anti")
+    return finalize_table(
+        pl.concat(
+            [kept.select(columns), update.select(columns)],
+            how="vertical_relaxed",
+        )
+    )
+
+
+def write_table(
+    table: pl.DataFrame,
+    output: Path,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+):
+    """
+    Write the taxonomy table atomically.
+
+    Parameters
+    ----------
+    table : pl.DataFrame
+        Taxonomy table sorted by name_key.
+    output : Path
+        Destination parquet file.
+    row_group_size : int
+        Rows per parquet row group.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(f".{output.name}.tmp")
+    table.write_parquet(
+        str(tmp_path),
+        compression="zstd",
+        statistics=True,
+        row_group_size=row_group_size,
+    )
+    os.replace(tmp_path, output)
+
+
+def main():
+    """Build or update the PBDB taxonomy table from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Build the local PBDB taxonomy table from PBDB exports."
+    )
+    parser.add_argument(
+        "--taxa",
+        type=Path,
+        required=True,
+        help="PBDB taxa export (JSON or CSV).",
+    )
+    parser.add_argument(
+        "--references",
+        type=Path,
+        default=None,
+        help="PBDB references export (JSON or CSV).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=PBDB_FILE,
+        help=f"Output parquet file (default: {PBDB_FILE}).",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Merge the export into the existing output file.",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help=f"Rows per row group (default: {DEFAULT_ROW_GROUP_SIZE}).",
+    )
+    args = parser.parse_args()
+
+    table = build_table(args.taxa, args.references)
+    if args.update and args.output.exists():
+        table = update_table(pl.read_parquet(str(args.output)), table)
+
+    write_table(table, args.output, args.row_group_size)
+    print(f"Wrote {len(table)} taxa to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
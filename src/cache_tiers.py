@@ -0,0 +1,253 @@
+"""
+Cache tiers in front of and behind the local results cache.
+
+The results cache is read through three tiers, nearest first:
+
+- L1, a bounded least recently used map in process memory;
+- L2, the local parquet store in taxonomy_cache;
+- L3, an optional store shared by every replica of the app.
+
+New results are written through to every tier, and a hit in a farther
+tier is promoted into the nearer ones, so a name resolved by any replica
+is resolved for all of them.
+
+Shared backends are pluggable: a backend subclasses SharedBackend,
+implementing its abstract methods, and is registered under a name in
+SHARED_BACKENDS, which the shared_cache.backend setting selects.
+Backends store JSON-compatible dicts keyed by cache key.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from sqlite_store import SQLiteStore, chunked
+
+
+class LRUCache:
+    """
+    Thread-safe bounded map that evicts the least recently used entries.
+
+    Parameters
+    ----------
+    max_entries : int
+        Number of entries kept.
+    ttl : float
+        Seconds an entry is served before it counts as a miss.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """
+        Get an entry and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            Entry key.
+
+        Returns
+        -------
+        Any
+            Stored value, or None if missing or older than the TTL.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any):
+        """
+        Store an entry, evicting the least recently used beyond the bound.
+
+        Parameters
+        ----------
+        key : str
+            Entry key.
+        value : Any
+            Value to store.
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedBackend(ABC):
+    """
+    Interface of a cache tier shared by all replicas.
+
+    Implementations must be safe to call from several threads and should
+    report their own errors rather than raise, since the shared tier is an
+    optimization and a search must not fail because it is unreachable.
+
+    Parameters
+    ----------
+    location : str
+        Backend-specific location, e.g. a file path or URL.
+    """
+
+    def __init__(self, location):
+        self.location = location
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Look up entries by key.
+
+        Parameters
+        ----------
+        keys : List[str]
+            Cache keys.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Stored entries keyed by the keys that were found.
+        """
+
+    @abstractmethod
+    def put_many(self, entries: dict[str, dict[str, Any]]):
+        """
+        Store entries, replacing any stored under the same keys.
+
+        Parameters
+        ----------
+        entries : Dict[str, Dict[str, Any]]
+            JSON-compatible entries keyed by cache key.
+        """
+
+
+class SQLiteBackend(SharedBackend):
+    """
+    Shared tier kept in a SQLite file that all replicas can reach.
+
+    The file may live on a network filesystem, so it uses SQLite's default
+    rollback journal rather than WAL, which needs shared memory between
+    the processes. A local file also stands in for a shared store in tests.
+
+    Parameters
+    ----------
+    location : str
+        Path of the SQLite file; relative paths are under data/.
+    """
+
+    def __init__(self, location):
+        super().__init__(location)
+        path = Path(location)
+        if not path.is_absolute():
+            path = Path(__file__).parent.parent / "data" / path
+        self.path = path
+        self._store = SQLiteStore(
+            [
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, "
+                "entry TEXT NOT NULL, "
+                "updated REAL NOT NULL)"
+            ],
+            wal=False,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection to the file.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Open connection.
+        """
+        return self._store.connect(self.path)
+
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        if not keys:
+            return {}
+
+        try:
+            conn = self._connect()
+            found = {}
+            for chunk in chunked(keys):
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT key, entry FROM results "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, entry in rows:
+                    found[key] = json.loads(entry)
+            return found
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Shared cache error: {e}")
+            return {}
+
+    def put_many(self, entries: dict[str, dict[str, Any]]):
+        if not entries:
+            return
+
+        now = time.time()
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO results (key, entry, updated) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (key, json.dumps(entry), now)
+                        for key, entry in entries.items()
+                    ],
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Shared cache error: {e}")
+
+
+# shared backends by the name used in the shared_cache.backend setting
+SHARED_BACKENDS: dict[str, type[SharedBackend]] = {"sqlite": SQLiteBackend}
+
+
+def make_shared_backend(name: str, location: str) -> SharedBackend | None:
+    """
+    Create the configured shared backend.
+
+    Parameters
+    ----------
+    name : str
+        Backend name from SHARED_BACKENDS, or "" for no shared tier.
+    location : str
+        Backend location.
+
+    Returns
+    -------
+    Optional[SharedBackend]
+        Backend, or None if the shared tier is disabled or unknown.
+    """
+    if not name:
+        return None
+    backend_class = SHARED_BACKENDS.get(name)
+    if backend_class is None:
+        print(f"Shared cache error: unknown backend {name!r}")
+        return None
+    return backend_class(location)
@@ -0,0 +1,159 @@
+"""
+Per-host circuit breakers and adaptive request timeouts.
+
+A breaker counts consecutive failed or slow requests to a host. Once the
+count reaches the configured threshold the breaker opens and requests to
+the host are refused immediately instead of each waiting out a timeout.
+After a cooldown the breaker half-opens and lets a single probe through:
+a good response closes it again, a bad one reopens it.
+
+Each breaker also keeps the latencies of recent successful requests, and
+request timeouts follow a percentile of them so a slow host does not hold
+every query for the full default timeout.
+"""
+
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from config_loader import (
+    BREAKER_COOLDOWN,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_LATENCY_WINDOW,
+    BREAKER_MAX_TIMEOUT,
+    BREAKER_MIN_SAMPLES,
+    BREAKER_MIN_TIMEOUT,
+    BREAKER_SLOW_CALL_THRESHOLD,
+    BREAKER_TIMEOUT_MULTIPLIER,
+    BREAKER_TIMEOUT_PERCENTILE,
+    DEFAULT_TIMEOUT,
+)
+
+# breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker and latency tracker for one host.
+
+    Parameters
+    ----------
+    host : str
+        Host name the breaker protects.
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.latencies = deque(maxlen=BREAKER_LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent, claiming the probe if half-open.
+
+        Returns
+        -------
+        bool
+            True if the request may be sent.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < BREAKER_COOLDOWN:
+                    return False
+                self.state = HALF_OPEN
+                self.probing = False
+            if self.state == HALF_OPEN:
+                if self.probing:
+                    return False
+                self.probing = True
+            return True
+
+    def record_success(self, latency: float):
+        """
+        Record a completed request.
+
+        Responses slower than the slow call threshold count as failures.
+
+        Parameters
+        ----------
+        latency : float
+            Request duration in seconds.
+        """
+        if latency > BREAKER_SLOW_CALL_THRESHOLD:
+            self.record_failure()
+            return
+        with self._lock:
+            self.latencies.append(latency)
+            self.failures = 0
+            self.state = CLOSED
+            self.probing = False
+
+    def record_failure(self):
+        """Record a failed request, opening the breaker if needed."""
+        with self._lock:
+            self.failures += 1
+            if (
+                self.state == HALF_OPEN
+                or self.failures >= BREAKER_FAILURE_THRESHOLD
+            ):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+    def timeout(self) -> float:
+        """
+        Get the request timeout adapted to recent latencies.
+
+        Returns
+        -------
+        float
+            Timeout in seconds: a percentile of recent latencies times a
+            multiplier, within the configured bounds, or the default
+            timeout until enough requests have been measured.
+        """
+        with self._lock:
+            if len(self.latencies) < BREAKER_MIN_SAMPLES:
+                return min(DEFAULT_TIMEOUT, BREAKER_MAX_TIMEOUT)
+            ordered = sorted(self.latencies)
+        index = min(
+            len(ordered) - 1,
+            int(BREAKER_TIMEOUT_PERCENTILE / 100 * len(ordered)),
+        )
+        timeout = ordered[index] * BREAKER_TIMEOUT_MULTIPLIER
+        return min(max(timeout, BREAKER_MIN_TIMEOUT), BREAKER_MAX_TIMEOUT)
+
+
+# one breaker per host, created on first use
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(url: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker for the host of a URL.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+
+    Returns
+    -------
+    CircuitBreaker
+        Breaker shared by all requests to the host.
+    """
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host)
+            _breakers[host] = breaker
+        return breaker
@@ -14,19 +14,100 @@ with open(_config_path, "rb") as f:
 PBDB_BASE_URL = _config["api"]["pbdb_base_url"]
 DEFAULT_TIMEOUT = _config["api"]["default_timeout"]
 NOT_AVAILABLE = _config["api"]["not_available"]
-API_DELAY = _config["api"]["api_delay"]
+SOURCE_WORKERS = _config["api"]["source_workers"]
+RESOLUTION_STRATEGY = _config["api"]["resolution_strategy"]
+SEARCH_DEADLINE = _config["api"]["search_deadline"]
 
 # External API constants
 CROSSREF_BASE_URL = _config["external_apis"]["crossref_base_url"]
 BHL_BASE_URL = _config["external_apis"]["bhl_base_url"]
 WORMS_BASE_URL = _config["external_apis"]["worms_base_url"]
 GBIF_BASE_URL = _config["external_apis"]["gbif_base_url"]
+WORMS_BATCH_SIZE = _config["external_apis"]["worms_batch_size"]
+
+# HTTP client constants
+HTTP_POOL_CONNECTIONS = _config["http"]["pool_connections"]
+HTTP_POOL_MAXSIZE = _config["http"]["pool_maxsize"]
+
+# Rate limit constants
+RATE_LIMIT_STATE_DIR_NAME = _config["rate_limits"]["state_dir_name"]
+RATE_LIMITS = _config["rate_limits"]["hosts"]
+
+# Response cache constants
+RESPONSE_CACHE_ENABLED = _config["response_cache"]["enabled"]
+RESPONSE_CACHE_FILE_NAME = _config["response_cache"]["file_name"]
+RESPONSE_CACHE_MAX_AGE = _config["response_cache"]["max_age"]
+RESPONSE_CACHE_MAX_BYTES = _config["response_cache"]["max_bytes"]
+
+# Circuit breaker constants
+BREAKER_FAILURE_THRESHOLD = _config["circuit_breaker"]["failure_threshold"]
+BREAKER_SLOW_CALL_THRESHOLD = _config["circuit_breaker"]["slow_call_threshold"]
+BREAKER_COOLDOWN = _config["circuit_breaker"]["cooldown"]
+BREAKER_TIMEOUT_PERCENTILE = _config["circuit_breaker"]["timeout_percentile"]
+BREAKER_TIMEOUT_MULTIPLIER = _config["circuit_breaker"]["timeout_multiplier"]
+BREAKER_MIN_TIMEOUT = _config["circuit_breaker"]["min_timeout"]
+BREAKER_MAX_TIMEOUT = _config["circuit_breaker"]["max_timeout"]
+BREAKER_MIN_SAMPLES = _config["circuit_breaker"]["min_samples"]
+BREAKER_LATENCY_WINDOW = _config["circuit_breaker"]["latency_window"]
+
+# Retry constants
+RETRY_MAX_ATTEMPTS = _config["retry"]["max_attempts"]
+RETRY_BASE_DELAY = _config["retry"]["base_delay"]
+RETRY_MAX_DELAY = _config["retry"]["max_delay"]
+RETRY_MAX_AFTER = _config["retry"]["max_retry_after"]
+RETRY_BUDGET_RATIO = _config["retry"]["budget_ratio"]
+RETRY_BUDGET_MIN_RETRIES = _config["retry"]["budget_min_retries"]
+RETRY_BUDGET_WINDOW = _config["retry"]["budget_window"]
+
+# Detail cache constants
+DETAIL_CACHE_FILE_NAME = _config["detail_cache"]["file_name"]
+DETAIL_CACHE_MAX_ENTRIES = _config["detail_cache"]["max_entries"]
+
+# DOI index constants
+DOI_INDEX_FILE_NAME = _config["doi_index"]["file_name"]
+
+# Source statistics constants
+SOURCE_STATS_FILE_NAME = _config["source_stats"]["file_name"]
+SOURCE_STATS_ADAPTIVE = _config["source_stats"]["adaptive"]
+SOURCE_STATS_MIN_SAMPLES = _config["source_stats"]["min_samples"]
+SOURCE_STATS_MIN_HIT_RATE = _config["source_stats"]["min_hit_rate"]
+SOURCE_STATS_MIN_WIN_RATE = _config["source_stats"]["min_win_rate"]
+SOURCE_STATS_SLOW_LATENCY = _config["source_stats"]["slow_latency"]
+SOURCE_STATS_EXPLORE_RATE = _config["source_stats"]["explore_rate"]
+SOURCE_STATS_LATENCY_WINDOW = _config["source_stats"]["latency_window"]
 
 # Cache constants
 CACHE_DIR_NAME = _config["cache"]["dir_name"]
 CACHE_SUBDIR_NAME = _config["cache"]["subdir_name"]
 CACHE_FILE_NAME = _config["cache"]["file_name"]
 
+# Results cache storage constants
+SEGMENT_DIR_NAME = _config["results_cache"]["segment_dir_name"]
+COMPACTION_SIZE_RATIO = _config["results_cache"]["compaction_size_ratio"]
+COMPACTION_MIN_SEGMENTS = _config["results_cache"]["compaction_min_segments"]
+COMPACTION_MAX_SEGMENTS = _config["results_cache"]["compaction_max_segments"]
+CACHE_MEMORY_ENTRIES = _config["results_cache"]["memory_entries"]
+CACHE_MEMORY_TTL = _config["results_cache"]["memory_ttl"]
+
+# Shared results cache constants
+SHARED_CACHE_BACKEND = _config["shared_cache"]["backend"]
+SHARED_CACHE_LOCATION = _config["shared_cache"]["location"]
+
+# Results cache policy constants
+CACHE_MAX_AGES = _config["cache_policy"]["max_age"]
+CACHE_STALE_WHILE_REVALIDATE = _config["cache_policy"][
+    "stale_while_revalidate"
+]
+CACHE_MAX_REFRESHES = _config["cache_policy"]["max_refreshes"]
+CACHE_MAX_ROWS = _config["cache_policy"]["max_rows"]
+CACHE_MAX_BYTES = _config["cache_policy"]["max_bytes"]
+CACHE_EVICTION = _config["cache_policy"]["eviction"]
+
+# Negative cache constants
+NEGATIVE_CACHE_FILE_NAME = _config["negative_cache"]["file_name"]
+NEGATIVE_CACHE_NO_MATCH_TTL = _config["negative_cache"]["no_match_ttl"]
+NEGATIVE_CACHE_ERROR_TTL = _config["negative_cache"]["error_ttl"]
+
 # HTTP headers for PBDB API requests
 PBDB_HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; fossil-species-references/1.0; +https://github.com/O957/fossil-species-references)",
@@ -3,14 +3,48 @@ Simplified database query functions for taxonomic information.
 """
 
 import re
+import threading
 import time
-from pathlib import Path
+from collections.abc import Iterator
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from typing import Any
 
 import polars as pl
 import requests
 
-from config_loader import API_DELAY, CROSSREF_BASE_URL, NOT_AVAILABLE
+import detail_cache
+import doi_index
+import http_client
+import source_stats
+import taxonomy_cache
+from config_loader import (
+    CROSSREF_BASE_URL,
+    NOT_AVAILABLE,
+    RESOLUTION_STRATEGY,
+    SOURCE_WORKERS,
+    WORMS_BATCH_SIZE,
+)
+from pbdb_table import (
+    PBDB_FILE,
+    YEAR_PATTERN,
+    pbdb_author_expr,
+    pbdb_name_key_expr,
+    pbdb_year_expr,
+)
+
+# errors raised while reading a response that does not have the expected
+# shape; the source answered, but not with a match or an empty result
+MALFORMED_RESPONSE_ERRORS = (
+    AttributeError,
+    KeyError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
 
 
 def extract_year(text: str) -> int | None:
@@ -31,7 +65,7 @@ def extract_year(text: str) -> int | None:
         return None
 
     # look for 4-digit years
-    years = re.findall(r"\b(1[7-9]\d{2}|20[0-2]\d)\b", text)
+    years = re.findall(YEAR_PATTERN, text)
     if years:
         return int(years[0])
     return None
@@ -140,6 +174,9 @@ def extract_paper_title(citation: str) -> str:
 def query_gbif(species_name: str) -> dict[str, Any] | None:
     """
     Query GBIF for taxonomic information.
+    Raises http_client.SourceUnavailableError if GBIF cannot be reached or
+    does not answer with a readable record.
+    Raises http_client.RequestRejectedError if GBIF rejects the request.
 
     Parameters
     ----------
@@ -156,18 +193,19 @@ def query_gbif(species_name: str) -> dict[str, Any] | None:
         match_url = f"{base_url}/species/match"
         params = {"name": species_name, "strict": False}
 
-        response = requests.get(match_url, params=params, timeout=5)
-        response.raise_for_status()
-        match_data = response.json()
+        match_data = http_client.get_json(match_url, params=params)
 
-        if match_data.get("matchType") != "NONE":
+        if match_data and match_data.get("matchType") != "NONE":
             usage_key = match_data.get("usageKey")
             if usage_key:
-                # get full record
-                detail_url = f"{base_url}/species/{usage_key}"
-                detail_response = requests.get(detail_url, timeout=5)
-                detail_response.raise_for_status()
-                detail_data = detail_response.json()
+                # get full record, unless this usageKey was seen before
+                detail_data = detail_cache.get_detail("GBIF", usage_key)
+                if detail_data is None:
+                    detail_url = f"{base_url}/species/{usage_key}"
+                    detail_data = http_client.get_json(detail_url)
+                    if not detail_data:
+                        return None
+                    detail_cache.put_detail("GBIF", usage_key, detail_data)
 
                 authorship = detail_data.get("authorship", NOT_AVAILABLE)
                 published_in = detail_data.get("publishedIn", NOT_AVAILABLE)
@@ -187,8 +225,10 @@ def query_gbif(species_name: str) -> dict[str, Any] | None:
                     "doi": NOT_AVAILABLE,
                     "source": "GBIF",
                 }
-    except Exception as e:
-        print(f"GBIF error: {e}")
+    except MALFORMED_RESPONSE_ERRORS as e:
+        raise http_client.SourceUnavailableError(
+            f"unexpected GBIF response: {e}"
+        ) from e
 
     return None
 
@@ -196,6 +236,9 @@ def query_gbif(species_name: str) -> dict[str, Any] | None:
 def query_zoobank(species_name: str) -> dict[str, Any] | None:
     """
     Query ZooBank for taxonomic information.
+    Raises http_client.SourceUnavailableError if ZooBank cannot be reached
+    or does not answer with a readable record.
+    Raises http_client.RequestRejectedError if ZooBank rejects the request.
 
     Parameters
     ----------
@@ -213,9 +256,7 @@ def query_zoobank(species_name: str) -> dict[str, Any] | None:
         )
         params = {"name": species_name, "exact": "true", "format": "json"}
 
-        response = requests.get(search_url, params=params, timeout=5)
-        response.raise_for_status()
-        data = response.json()
+        data = http_client.get_json(search_url, params=params)
 
         if data and isinstance(data, list) and len(data) > 0:
             record = data[0]
@@ -228,16 +269,103 @@ def query_zoobank(species_name: str) -> dict[str, Any] | None:
                 "doi": record.get("doi", NOT_AVAILABLE),
                 "source": "ZooBank",
             }
-    except (requests.RequestException, KeyError, IndexError, ValueError):
-        pass
+    except MALFORMED_RESPONSE_ERRORS as e:
+        raise http_client.SourceUnavailableError(
+            f"unexpected ZooBank response: {e}"
+        ) from e
 
     return None
 
 
+# PBDB table and lowercase-name index, loaded once per process and reloaded
+# only if the file's modification time changes
+_pbdb_table: pl.DataFrame | None = None
+_pbdb_index: dict[str, int] = {}
+_pbdb_mtime: int | None = None
+_pbdb_keyed: pl.DataFrame | None = None
+_pbdb_lock = threading.Lock()
+
+
+def _load_pbdb_table() -> tuple[pl.DataFrame | None, dict[str, int]]:
+    """
+    Get the resident PBDB table and its name index.
+
+    Returns
+    -------
+    Tuple[Optional[pl.DataFrame], Dict[str, int]]
+        The PBDB table (None if the file is missing) and a mapping of
+        lowercase name to the first row with that name.
+    """
+    global _pbdb_table, _pbdb_index, _pbdb_keyed, _pbdb_mtime
+
+    try:
+        mtime = PBDB_FILE.stat().st_mtime_ns
+    except OSError:
+        return None, {}
+
+    with _pbdb_lock:
+        if _pbdb_table is None or mtime != _pbdb_mtime:
+            table = pl.read_parquet(str(PBDB_FILE))
+            index = {}
+            names = table.select(pbdb_name_key_expr(table)).to_series()
+            names = names.to_list()
+            for i, name in enumerate(names):
+                if name is not None:
+                    index.setdefault(name, i)
+            _pbdb_table = table
+            _pbdb_index = index
+            _pbdb_keyed = None
+            _pbdb_mtime = mtime
+        return _pbdb_table, _pbdb_index
+
+
+def _pbdb_row_to_result(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a PBDB table row into a taxonomic information dictionary.
+
+    Parameters
+    ----------
+    row : Dict[str, Any]
+        Row of the PBDB table.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Taxonomic information.
+    """
+    att = row.get("att", NOT_AVAILABLE)
+    full_reference = row.get("ref", NOT_AVAILABLE)
+
+    # extract author from authority or reference
+    author = extract_author(att)
+    if author == NOT_AVAILABLE and full_reference != NOT_AVAILABLE:
+        # try to extract from reference (e.g., "E. D. Cope. 1874. ...")
+        parts = full_reference.split(".")
+        if parts:
+            author = parts[0].strip()
+
+    # extract year from authority
+    year = extract_year(att)
+
+    return {
+        "taxonomic_authority": att,
+        "reference": full_reference,  # complete citation as it appears
+        "year": year,
+        "author": author,
+        "doi": row.get("doi", NOT_AVAILABLE)
+        if row.get("doi") not in ["null", None]
+        else NOT_AVAILABLE,
+        "source": "PBDB",
+    }
+
+
 def query_pbdb_local(species_name: str) -> dict[str, Any] | None:
     """
     Query local PBDB parquet file.
 
+    The table is kept in memory with a precomputed name index, so each
+    lookup is a dictionary access plus a single row fetch.
+
     Parameters
     ----------
     species_name : str
@@ -249,56 +377,117 @@ def query_pbdb_local(species_name: str) -> dict[str, Any] | None:
         Taxonomic information or None.
     """
     try:
-        pbdb_file = (
-            Path(__file__).parent.parent
-            / "data"
-            / "pbdb_essential_taxonomy_with_refs.parquet"
-        )
-        if not pbdb_file.exists():
+        table, index = _load_pbdb_table()
+        if table is None:
             return None
 
-        df = pl.read_parquet(str(pbdb_file))
-
         # search for exact match (case-insensitive)
-        result = df.filter(
-            pl.col("nam").str.to_lowercase() == species_name.lower()
-        )
+        row_index = index.get(species_name.lower())
+        if row_index is not None:
+            return _pbdb_row_to_result(table.row(row_index, named=True))
+    except Exception as e:
+        print(f"Error querying PBDB: {e}")
 
-        if not result.is_empty():
-            row = result.to_dicts()[0]
-            att = row.get("att", NOT_AVAILABLE)
-            full_reference = row.get("ref", NOT_AVAILABLE)
+    return None
 
-            # extract author from authority or reference
-            author = extract_author(att)
-            if author == NOT_AVAILABLE and full_reference != NOT_AVAILABLE:
-                # try to extract from reference (e.g., "E. D. Cope. 1874. ...")
-                parts = full_reference.split(".")
-                if parts:
-                    author = parts[0].strip()
 
-            # extract year from authority
-            year = extract_year(att)
+def _pbdb_keyed_table() -> pl.DataFrame | None:
+    """
+    Get the PBDB table keyed by lowercase name, one row per name.
 
-            return {
-                "taxonomic_authority": att,
-                "reference": full_reference,  # complete citation as it appears
-                "year": year,
-                "author": author,
-                "doi": row.get("doi", NOT_AVAILABLE)
-                if row.get("doi") not in ["null", None]
-                else NOT_AVAILABLE,
-                "source": "PBDB",
-            }
+    Returns
+    -------
+    Optional[pl.DataFrame]
+        The first row for each name with an added "_key" column, or None
+        if the PBDB file is missing.
+    """
+    global _pbdb_keyed
+
+    table, _ = _load_pbdb_table()
+    if table is None:
+        return None
+
+    with _pbdb_lock:
+        if _pbdb_keyed is None or _pbdb_table is not table:
+            _pbdb_keyed = (
+                table.with_columns(pbdb_name_key_expr(table).alias("_key"))
+                .filter(pl.col("_key").is_not_null())
+                .unique(subset="_key", keep="first", maintain_order=True)
+            )
+        return _pbdb_keyed
+
+
+def query_pbdb_local_many(species_names: list[str]) -> pl.DataFrame:
+    """
+    Query the local PBDB table for many species with a single join.
+
+    Parameters
+    ----------
+    species_names : List[str]
+        Species names to search.
+
+    Returns
+    -------
+    pl.DataFrame
+        One row per input name found in PBDB, with columns search_term (as
+        given), taxonomic_authority, reference, year, author, doi and
+        source.
+    """
+    columns = {
+        "search_term": pl.Utf8,
+        "taxonomic_authority": pl.Utf8,
+        "reference": pl.Utf8,
+        "year": pl.Int64,
+        "author": pl.Utf8,
+        "doi": pl.Utf8,
+        "source": pl.Utf8,
+    }
+
+    try:
+        keyed = _pbdb_keyed_table()
+        if keyed is None or not species_names:
+            return pl.DataFrame(schema=columns)
+
+        inputs = pl.DataFrame(
+            {"search_term": species_names}, schema={"search_term": pl.Utf8}
+        ).with_columns(pl.col("search_term").str.to_lowercase().alias("_key"))
+        matched = inputs.join(keyed, on="_key", how="inner")
+
+        # use year and author columns precomputed by build_pbdb_taxonomy
+        att = pl.col("att")
+        ref = pl.col("ref")
+        year = (
+            pl.col("year") if "year" in keyed.columns else pbdb_year_expr(att)
+        )
+        author = (
+            pl.col("author")
+            if "author" in keyed.columns
+            else pbdb_author_expr(att, ref)
+        )
+        return matched.select(
+            pl.col("search_term"),
+            att.alias("taxonomic_authority"),
+            ref.alias("reference"),
+            year.alias("year"),
+            author.alias("author"),
+            pl.when(pl.col("doi").is_null() | (pl.col("doi") == "null"))
+            .then(pl.lit(NOT_AVAILABLE))
+            .otherwise(pl.col("doi"))
+            .alias("doi"),
+            pl.lit("PBDB").alias("source"),
+        )
     except Exception as e:
         print(f"Error querying PBDB: {e}")
 
-    return None
+    return pl.DataFrame(schema=columns)
 
 
 def query_worms(species_name: str) -> dict[str, Any] | None:
     """
     Query WoRMS for marine species information.
+    Raises http_client.SourceUnavailableError if WoRMS cannot be reached or
+    does not answer with a readable record.
+    Raises http_client.RequestRejectedError if WoRMS rejects the request.
 
     Parameters
     ----------
@@ -316,48 +505,166 @@ def query_worms(species_name: str) -> dict[str, Any] | None:
         search_url = f"{WORMS_BASE_URL}/AphiaRecordsByMatchNames"
         params = {"scientificnames[]": species_name, "marine_only": "false"}
 
-        response = requests.get(search_url, params=params, timeout=5)
-        response.raise_for_status()
-        data = response.json()
+        data = http_client.get_json(search_url, params=params)
 
         if data and isinstance(data, list) and data[0]:
             matches = data[0]
             if matches and isinstance(matches, list):
                 record = matches[0]
 
-                # get citation
+                # get citation, unless this AphiaID was seen before
                 aphia_id = record.get("AphiaID")
                 if aphia_id:
-                    base_url = WORMS_BASE_URL
-                    citation_url = (
-                        f"{base_url}/AphiaRecordByAphiaID/{aphia_id}"
-                    )
-                    citation_response = requests.get(citation_url, timeout=5)
-                    citation_response.raise_for_status()
-                    full_record = citation_response.json()
-
-                    authority = full_record.get("authority", NOT_AVAILABLE)
-                    return {
-                        "taxonomic_authority": authority,
-                        "reference": full_record.get(
-                            "citation", NOT_AVAILABLE
-                        ),
-                        "year": extract_year(authority),
-                        "author": extract_author(authority),
-                        "doi": NOT_AVAILABLE,
-                        "source": "WoRMS",
-                    }
-    except (requests.RequestException, KeyError, IndexError, ValueError):
-        pass
+                    full_record = detail_cache.get_detail("WoRMS", aphia_id)
+                    if full_record is None:
+                        base_url = WORMS_BASE_URL
+                        citation_url = (
+                            f"{base_url}/AphiaRecordByAphiaID/{aphia_id}"
+                        )
+                        full_record = http_client.get_json(citation_url)
+                        if not full_record:
+                            return None
+                        detail_cache.put_detail("WoRMS", aphia_id, full_record)
+
+                    return _worms_record_to_result(full_record)
+    except MALFORMED_RESPONSE_ERRORS as e:
+        raise http_client.SourceUnavailableError(
+            f"unexpected WoRMS response: {e}"
+        ) from e
 
     return None
 
 
+def _worms_record_to_result(full_record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a full WoRMS Aphia record into taxonomic information.
+
+    Parameters
+    ----------
+    full_record : Dict[str, Any]
+        Record from AphiaRecordByAphiaID or AphiaRecordsByAphiaIDs.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Taxonomic information.
+    """
+    authority = full_record.get("authority", NOT_AVAILABLE)
+    return {
+        "taxonomic_authority": authority,
+        "reference": full_record.get("citation", NOT_AVAILABLE),
+        "year": extract_year(authority),
+        "author": extract_author(authority),
+        "doi": NOT_AVAILABLE,
+        "source": "WoRMS",
+    }
+
+
+def _worms_get_list(url: str, params: dict[str, Any]) -> list:
+    """
+    Get a list response from WoRMS, treating 204 No Content as empty.
+
+    Parameters
+    ----------
+    url : str
+        WoRMS REST endpoint.
+    params : Dict[str, Any]
+        Query parameters; list values are sent as repeated keys.
+
+    Returns
+    -------
+    list
+        Decoded response.
+    """
+    data = http_client.get_json(url, params=params)
+    return data if isinstance(data, list) else []
+
+
+def query_worms_many(
+    species_names: list[str],
+) -> dict[str, dict[str, Any] | None]:
+    """
+    Query WoRMS for many species with batched requests.
+
+    Names are matched in chunks through AphiaRecordsByMatchNames, and the
+    full records of all distinct matched AphiaIDs are then fetched in
+    chunks through AphiaRecordsByAphiaIDs.
+
+    Parameters
+    ----------
+    species_names : List[str]
+        Species names to search.
+
+    Returns
+    -------
+    Dict[str, Optional[Dict[str, Any]]]
+        Taxonomic information (or None if WoRMS had no match) for each
+        input name. Names whose requests failed are left out, so callers
+        can fall back to query_worms for them.
+    """
+    from config_loader import WORMS_BASE_URL
+
+    names = list(dict.fromkeys(species_names))
+    aphia_ids = {}
+    for start in range(0, len(names), WORMS_BATCH_SIZE):
+        chunk = names[start : start + WORMS_BATCH_SIZE]
+        try:
+            data = _worms_get_list(
+                f"{WORMS_BASE_URL}/AphiaRecordsByMatchNames",
+                {"scientificnames[]": chunk, "marine_only": "false"},
+            )
+        except requests.RequestException:
+            continue
+
+        # matches come back as one list per name, in request order
+        for i, name in enumerate(chunk):
+            matches = data[i] if i < len(data) else None
+            if matches and isinstance(matches, list):
+                aphia_ids[name] = matches[0].get("AphiaID")
+            else:
+                aphia_ids[name] = None
+
+    # fetch each distinct record once, skipping AphiaIDs seen before
+    unique_ids = list(dict.fromkeys(i for i in aphia_ids.values() if i))
+    records = detail_cache.get_details("WoRMS", unique_ids)
+    unique_ids = [i for i in unique_ids if i not in records]
+    failed_ids = set()
+    for start in range(0, len(unique_ids), WORMS_BATCH_SIZE):
+        chunk = unique_ids[start : start + WORMS_BATCH_SIZE]
+        try:
+            data = _worms_get_list(
+                f"{WORMS_BASE_URL}/AphiaRecordsByAphiaIDs",
+                {"aphiaids[]": chunk},
+            )
+        except requests.RequestException:
+            failed_ids.update(chunk)
+            continue
+
+        fetched = {
+            record["AphiaID"]: record
+            for record in data
+            if isinstance(record, dict) and record.get("AphiaID")
+        }
+        detail_cache.put_details("WoRMS", fetched)
+        records.update(fetched)
+
+    results = {}
+    for name, aphia_id in aphia_ids.items():
+        if aphia_id in failed_ids:
+            continue
+        record = records.get(aphia_id) if aphia_id else None
+        results[name] = _worms_record_to_result(record) if record else None
+
+    return results
+
+
 def query_crossref(
     reference: str, author: str | None = None, year: int | None = None
 ) -> dict[str, str] | None:
     """
     Query CrossRef for publication DOI and link.
+    Raises http_client.SourceUnavailableError if CrossRef cannot be
+    reached.
 
     Parameters
     ----------
@@ -376,6 +683,11 @@ def query_crossref(
     if not reference or reference == NOT_AVAILABLE:
         return None
 
+    # references shared by sibling species are only resolved once
+    known = doi_index.lookup(reference)
+    if known is not None:
+        return known
+
     try:
         # search for the complete reference as it appears, not extracted parts
         # this ensures we find the exact paper that matches the displayed
@@ -399,15 +711,9 @@ def query_crossref(
             "select": "DOI,URL,title,author,published-print,published-online",
         }
 
-        response = requests.get(
-            CROSSREF_BASE_URL,
-            params=params,
-            timeout=10,  # increased timeout
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = http_client.get_json(CROSSREF_BASE_URL, params=params)
 
-        if data.get("message", {}).get("items"):
+        if data and data.get("message", {}).get("items"):
             # find best match by comparing the full reference with CrossRef
             # results
             for item in data["message"]["items"]:
@@ -434,14 +740,324 @@ def query_crossref(
                     if not url and doi != NOT_AVAILABLE:
                         url = f"https://doi.org/{doi}"
 
-                    return {"doi": doi, "paper_link": url or NOT_AVAILABLE}
+                    resolved = {"doi": doi, "paper_link": url or NOT_AVAILABLE}
+                    doi_index.store(reference, resolved)
+                    return resolved
+    except http_client.SourceUnavailableError:
+        raise
     except Exception as e:
         print(f"CrossRef error: {e}")
 
     return None
 
 
-def search_taxonomy(species_name: str) -> dict[str, Any]:
+# databases searched for every species, in order of authority preference
+DATABASES = [
+    ("GBIF", query_gbif),
+    ("ZooBank", query_zoobank),
+    ("PBDB", query_pbdb_local),
+    ("WoRMS", query_worms),
+]
+
+# databases answered from local files, never skipped by source planning
+LOCAL_DATABASES = ("PBDB",)
+
+# resolution strategies accepted by search_taxonomy
+RESOLUTION_STRATEGIES = ("complete", "fast")
+
+# phrases marking references that cite a modern database
+DATABASE_CITATION_INDICATORS = [
+    "accessed through",
+    "fishbase",
+    "world register",
+    "editors",
+    "database",
+]
+
+# shared pool for querying databases concurrently
+_source_executor = ThreadPoolExecutor(
+    max_workers=SOURCE_WORKERS, thread_name_prefix="source-query"
+)
+
+# pool finishing searches that returned a partial result at their deadline;
+# separate from the source pool so waiting here cannot starve the queries
+_completion_executor = ThreadPoolExecutor(
+    max_workers=SOURCE_WORKERS, thread_name_prefix="search-completion"
+)
+
+
+def is_database_citation(reference: str) -> bool:
+    """
+    Check whether a reference cites a modern database, not a publication.
+
+    Parameters
+    ----------
+    reference : str
+        Reference string.
+
+    Returns
+    -------
+    bool
+        True if the reference looks like a database citation.
+    """
+    ref_lower = reference.lower()
+    return any(
+        indicator in ref_lower for indicator in DATABASE_CITATION_INDICATORS
+    )
+
+
+def _is_conclusive(db_result: dict[str, Any] | None) -> bool:
+    """
+    Check whether a local result settles the search on its own.
+
+    A result is conclusive if its reference is year-matched to its
+    authority, is not a database citation, and has a DOI either directly
+    or through the local DOI index.
+
+    Parameters
+    ----------
+    db_result : Optional[Dict[str, Any]]
+        Taxonomic information from a local source.
+
+    Returns
+    -------
+    bool
+        True if no remote source needs to be queried.
+    """
+    if not db_result or db_result.get("taxonomic_authority") == NOT_AVAILABLE:
+        return False
+
+    reference = db_result.get("reference", NOT_AVAILABLE)
+    year = db_result.get("year")
+    if (
+        not reference
+        or reference == NOT_AVAILABLE
+        or not year
+        or extract_year(reference) != year
+        or is_database_citation(reference)
+    ):
+        return False
+
+    if db_result.get("doi") not in [None, "null", NOT_AVAILABLE]:
+        return True
+    return doi_index.lookup(reference) is not None
+
+
+def _timed_query(
+    db_name: str, query_func, species_name: str
+) -> tuple[dict[str, Any] | None, str | None]:
+    """
+    Query one database and record its hit and latency statistics.
+
+    Misses and failures of remote databases are saved to the negative
+    cache, and a database with a fresh negative entry for the name is not
+    queried. A rejected request counts as a miss, since the database
+    would reject the name again.
+
+    Parameters
+    ----------
+    db_name : str
+        Database name.
+    query_func : Callable
+        Query function of the database.
+    species_name : str
+        Scientific name to search for.
+
+    Returns
+    -------
+    Tuple[Optional[Dict[str, Any]], Optional[str]]
+        Result of the query (None if there is no match), and the error if
+        the database could not be reached.
+    """
+    # remote databases are skipped while a recent miss or error is cached
+    remote = db_name not in LOCAL_DATABASES
+    if remote:
+        outcome = taxonomy_cache.lookup_negative(species_name, db_name)
+        if outcome == taxonomy_cache.NO_MATCH:
+            return None, None
+        if outcome == taxonomy_cache.SOURCE_ERROR:
+            return None, "failed recently"
+
+    start = time.perf_counter()
+    sent = http_client.requests_sent()
+    try:
+        db_result = query_func(species_name)
+    except http_client.SourceUnavailableError as e:
+        # failures say nothing about the database's hit rate
+        print(f"{db_name} unavailable: {e}")
+        if remote:
+            taxonomy_cache.save_negative(
+                species_name, db_name, taxonomy_cache.SOURCE_ERROR
+            )
+        return None, str(e)
+    except http_client.RequestRejectedError as e:
+        # the database will reject this name again, so it counts as a miss
+        print(f"{db_name} rejected {species_name}: {e}")
+        taxonomy_cache.save_negative(
+            species_name, db_name, taxonomy_cache.NO_MATCH
+        )
+        return None, None
+
+    # remote answers replayed from the response cache say nothing about
+    # the database's latency
+    latency = time.perf_counter() - start
+    if remote and http_client.requests_sent() == sent:
+        latency = None
+    source_stats.record_query(species_name, db_name, bool(db_result), latency)
+    if remote and not db_result:
+        taxonomy_cache.save_negative(
+            species_name, db_name, taxonomy_cache.NO_MATCH
+        )
+    return db_result, None
+
+
+def _start_queries(
+    species_name: str, prefetched: dict[str, dict[str, Any] | None]
+) -> dict[str, Future]:
+    """
+    Start querying all databases concurrently.
+
+    Databases that almost never answer for the name's group may be
+    skipped (see source_stats.plan_sources).
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name to search for.
+    prefetched : Dict[str, Optional[Dict[str, Any]]]
+        Results already obtained for some databases, keyed by name. These
+        databases are not queried.
+
+    Returns
+    -------
+    Dict[str, Future]
+        Pending _timed_query results keyed by database name.
+    """
+    query_funcs = dict(DATABASES)
+    planned = source_stats.plan_sources(
+        species_name,
+        [db_name for db_name, _ in DATABASES if db_name not in prefetched],
+        always=LOCAL_DATABASES,
+    )
+    return {
+        db_name: _source_executor.submit(
+            _timed_query, db_name, query_funcs[db_name], species_name
+        )
+        for db_name in planned
+    }
+
+
+def _collect_results(
+    prefetched: dict[str, dict[str, Any] | None],
+    futures: dict[str, Future],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """
+    Gather database results, waiting for the given queries to finish.
+
+    Parameters
+    ----------
+    prefetched : Dict[str, Optional[Dict[str, Any]]]
+        Results already obtained for some databases, keyed by name.
+    futures : Dict[str, Future]
+        Queries to wait for, keyed by database name. Databases in neither
+        argument count as having no match.
+
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], List[str]]
+        Non-empty results in DATABASES order, and the names of databases
+        that could not be reached.
+    """
+    # results are collected in DATABASES order (GBIF first) so
+    # reconciliation does not depend on which source answers first
+    all_results = []
+    degraded = []
+    for db_name, _ in DATABASES:
+        if db_name in prefetched:
+            db_result = prefetched[db_name]
+        elif db_name in futures:
+            db_result, error = futures[db_name].result()
+            if error is not None:
+                degraded.append(db_name)
+        else:
+            db_result = None
+        if db_result:
+            all_results.append(db_result)
+
+    return all_results, degraded
+
+
+def _record_reference_win(
+    species_name: str,
+    all_results: list[dict[str, Any]],
+    result: dict[str, Any],
+):
+    """
+    Record which database supplied the reference of a reconciled result.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name that was searched.
+    all_results : List[Dict[str, Any]]
+        Results from the databases.
+    result : Dict[str, Any]
+        Reconciled result.
+    """
+    reference = result.get("reference", NOT_AVAILABLE)
+    if reference == NOT_AVAILABLE:
+        return
+    for db_result in all_results:
+        if db_result.get("reference") == reference:
+            source_stats.record_win(species_name, db_result["source"])
+            return
+
+
+def _resolved_locally(
+    species_name: str,
+    prefetched: dict[str, dict[str, Any] | None],
+    strategy: str,
+) -> dict[str, Any] | None:
+    """
+    Check the strategy and whether the local PBDB table settles a search.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name to search for.
+    prefetched : Dict[str, Optional[Dict[str, Any]]]
+        Results already obtained for some databases, keyed by name. The
+        PBDB result is added if the "fast" strategy looks it up.
+    strategy : str
+        Resolution strategy (see search_taxonomy).
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The PBDB result if the strategy is "fast" and the result is
+        conclusive, otherwise None.
+    """
+    if strategy not in RESOLUTION_STRATEGIES:
+        raise ValueError(
+            f"Unknown resolution strategy {strategy!r}; expected one of "
+            f"{', '.join(RESOLUTION_STRATEGIES)}"
+        )
+
+    if strategy != "fast":
+        return None
+    if "PBDB" not in prefetched:
+        prefetched["PBDB"] = query_pbdb_local(species_name)
+    local = prefetched["PBDB"]
+    return local if local is not None and _is_conclusive(local) else None
+
+
+def search_taxonomy(
+    species_name: str,
+    prefetched: dict[str, dict[str, Any] | None] | None = None,
+    strategy: str = RESOLUTION_STRATEGY,
+    deadline: float | None = None,
+    on_complete=None,
+) -> dict[str, Any]:
     """
     Search for taxonomic information across databases.
     Searches all databases to find the most complete information,
@@ -451,6 +1067,225 @@ def search_taxonomy(species_name: str) -> dict[str, Any]:
     ----------
     species_name : str
         Scientific name to search for.
+    prefetched : Dict[str, Optional[Dict[str, Any]]]
+        Optional results already obtained for some databases, keyed by
+        database name (e.g. from a batch PBDB lookup). These databases are
+        not queried again; None means the database had no match.
+    strategy : str
+        "complete" queries every database. "fast" first checks the local
+        PBDB table and stops there if it has a year-matched,
+        non-database reference with a known DOI.
+    deadline : float
+        Optional number of seconds to wait for the databases and the
+        CrossRef DOI lookup. If the search has not finished by then, the
+        result is reconciled from the databases that have answered (with
+        DOIs from the local DOI index only), marked with partial=True, and
+        the search goes on in the background.
+    on_complete : Callable
+        Optional function called from a background thread with the
+        complete result (None if the search failed) when a partial result
+        was returned.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Search results with taxonomic authority, reference, DOI, etc.
+        degraded_sources lists the sources that could not be reached, so
+        the result can be re-resolved once they recover.
+    """
+    prefetched = dict(prefetched or {})
+    local = _resolved_locally(species_name, prefetched, strategy)
+    if local is not None:
+        return reconcile_results(species_name, [local])
+
+    futures = _start_queries(species_name, prefetched)
+    if deadline is None:
+        return _finish_search(species_name, prefetched, futures)
+
+    # the deadline covers the databases and the CrossRef lookup alike
+    completion = _completion_executor.submit(
+        _finish_search, species_name, prefetched, futures
+    )
+    try:
+        return completion.result(timeout=max(deadline, 0.0))
+    except TimeoutError:
+        pass
+
+    # reconcile what has answered, without waiting on CrossRef, and let
+    # the search finish in the background
+    answered = {
+        db_name: future for db_name, future in futures.items() if future.done()
+    }
+    all_results, degraded = _collect_results(prefetched, answered)
+    result = reconcile_results(species_name, all_results, lookup_doi=False)
+    result["degraded_sources"] = ", ".join(degraded)
+    result["partial"] = True
+    completion.add_done_callback(
+        lambda future: _complete_search(species_name, future, on_complete)
+    )
+    return result
+
+
+def _finish_search(
+    species_name: str,
+    prefetched: dict[str, dict[str, Any] | None],
+    futures: dict[str, Future],
+) -> dict[str, Any]:
+    """
+    Wait for all database queries and reconcile their results.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name to search for.
+    prefetched : Dict[str, Optional[Dict[str, Any]]]
+        Results already obtained for some databases, keyed by name.
+    futures : Dict[str, Future]
+        Queries started by _start_queries.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Complete search result.
+    """
+    all_results, degraded = _collect_results(prefetched, futures)
+    result = reconcile_results(species_name, all_results)
+    _record_reference_win(species_name, all_results, result)
+
+    if result["degraded_sources"]:
+        degraded.append(result["degraded_sources"])
+    result["degraded_sources"] = ", ".join(degraded)
+    return result
+
+
+def _complete_search(species_name: str, completion: Future, on_complete):
+    """
+    Hand over the result of a search that returned a partial result.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name that was searched.
+    completion : Future
+        Finished _finish_search call of the search.
+    on_complete : Callable
+        Optional function called with the complete result, or with None
+        if the search failed.
+    """
+    try:
+        result = completion.result()
+    except Exception as e:
+        print(f"Background search error for {species_name}: {e}")
+        result = None
+    if on_complete is not None:
+        on_complete(result)
+
+
+def stream_taxonomy(
+    species_name: str,
+    prefetched: dict[str, dict[str, Any] | None] | None = None,
+    strategy: str = RESOLUTION_STRATEGY,
+) -> Iterator[dict[str, Any]]:
+    """
+    Search like search_taxonomy, yielding events as databases answer.
+
+    Every event is a dictionary with "event", "source" and "elapsed"
+    (seconds since the search started) keys:
+
+    - "started" when a database query is sent;
+    - "result" when a database answers, with its "result" and the
+      "provisional" result reconciled from the answers so far (DOIs from
+      the local DOI index only);
+    - "miss" when a database has no match;
+    - "error" when a database cannot be reached, with the "error";
+    - "final" once, last, with the complete reconciled "result" (its
+      source key is None).
+
+    Prefetched databases are reported as answering immediately.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name to search for.
+    prefetched : Dict[str, Optional[Dict[str, Any]]]
+        Optional results already obtained for some databases, keyed by
+        database name.
+    strategy : str
+        Resolution strategy (see search_taxonomy).
+
+    Yields
+    ------
+    Dict[str, Any]
+        Search events.
+    """
+    start = time.perf_counter()
+    prefetched = dict(prefetched or {})
+    answered = dict(prefetched)
+
+    def event(kind: str, source: str | None, **fields) -> dict[str, Any]:
+        return {
+            "event": kind,
+            "source": source,
+            "elapsed": time.perf_counter() - start,
+            **fields,
+        }
+
+    def answer(db_name: str, db_result, error) -> dict[str, Any]:
+        if error is not None:
+            return event("error", db_name, error=error)
+        if not db_result:
+            return event("miss", db_name)
+        answered[db_name] = db_result
+        all_results, _ = _collect_results(answered, {})
+        provisional = reconcile_results(
+            species_name, all_results, lookup_doi=False
+        )
+        return event(
+            "result", db_name, result=db_result, provisional=provisional
+        )
+
+    local = _resolved_locally(species_name, prefetched, strategy)
+    if local is not None:
+        yield answer("PBDB", local, None)
+        result = reconcile_results(species_name, [local])
+        yield event("final", None, result=result)
+        return
+
+    for db_name, _ in DATABASES:
+        if db_name in prefetched:
+            yield answer(db_name, prefetched[db_name], None)
+
+    futures = _start_queries(species_name, prefetched)
+    names = {future: db_name for db_name, future in futures.items()}
+    for db_name in futures:
+        yield event("started", db_name)
+    for future in as_completed(names):
+        yield answer(names[future], *future.result())
+
+    result = _finish_search(species_name, prefetched, futures)
+    yield event("final", None, result=result)
+
+
+def reconcile_results(
+    species_name: str,
+    all_results: list[dict[str, Any]],
+    lookup_doi: bool = True,
+) -> dict[str, Any]:
+    """
+    Combine database results into a single search result.
+
+    The first available authority is used, the best year-matched reference
+    is chosen by score, and CrossRef is asked for a missing DOI.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name that was searched for.
+    all_results : List[Dict[str, Any]]
+        Non-empty database results, in order of authority preference.
+    lookup_doi : bool
+        Whether CrossRef may be asked for a missing DOI; if False only the
+        local DOI index is used.
 
     Returns
     -------
@@ -469,27 +1304,10 @@ def search_taxonomy(species_name: str) -> dict[str, Any]:
         "source": NOT_AVAILABLE,
         # flag for reference year not matching authority year
         "year_mismatch": False,
+        # sources that could not be reached
+        "degraded_sources": "",
     }
 
-    # sequential database search (GBIF first)
-    databases = [
-        ("GBIF", query_gbif),
-        ("ZooBank", query_zoobank),
-        ("PBDB", query_pbdb_local),
-        ("WoRMS", query_worms),
-    ]
-
-    # collect all results from databases
-    all_results = []
-    for db_name, query_func in databases:
-        db_result = query_func(species_name)
-        if db_result:
-            all_results.append(db_result)
-
-        # small delay between API calls
-        if db_name not in ["PBDB"]:  # no delay for local file
-            time.sleep(API_DELAY)
-
     # if no results at all, return empty result
     if not all_results:
         return result
@@ -508,7 +1326,7 @@ def search_taxonomy(species_name: str) -> dict[str, Any]:
 
     # find best reference using smart prioritization - ONLY accept references
     # with matching years
-    valid_references = []
+    valid_references: list[dict[str, Any]] = []
     mismatched_references = []
 
     for db_result in all_results:
@@ -537,17 +1355,7 @@ def search_taxonomy(species_name: str) -> dict[str, Any]:
                     score -= 300  # penalize GBIF for abbreviated references
 
                 # prioritize sources that aren't modern database citations
-                ref_lower = ref.lower()
-                if any(
-                    indicator in ref_lower
-                    for indicator in [
-                        "accessed through",
-                        "fishbase",
-                        "world register",
-                        "editors",
-                        "database",
-                    ]
-                ):
+                if is_database_citation(ref):
                     score -= 500  # penalize modern database citations
 
                 # prefer longer references (more complete bibliographic info)
@@ -606,9 +1414,17 @@ def search_taxonomy(species_name: str) -> dict[str, Any]:
     if result["reference"] != NOT_AVAILABLE and (
         result["doi"] == NOT_AVAILABLE or result["doi"] is None
     ):
-        crossref_result = query_crossref(
-            result["reference"], result["author"], result["year"]
-        )
+        try:
+            if lookup_doi:
+                crossref_result = query_crossref(
+                    result["reference"], result["author"], result["year"]
+                )
+            else:
+                crossref_result = doi_index.lookup(result["reference"])
+        except http_client.SourceUnavailableError as e:
+            print(f"CrossRef unavailable: {e}")
+            crossref_result = None
+            result["degraded_sources"] = "CrossRef"
 
         if crossref_result:
             result["doi"] = crossref_result["doi"]
@@ -0,0 +1,185 @@
+"""
+Persistent cache of source detail records keyed by source identifier.
+
+GBIF species records (keyed by usageKey) and WoRMS Aphia records (keyed by
+AphiaID) are the second, more expensive request of their lookups. Different
+spellings and synonyms of a name resolve to the same identifier, so caching
+the detail record by identifier lets those lookups skip the second request.
+Records are kept in a SQLite file, bounded per source by evicting the least
+recently used entries.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from config_loader import DETAIL_CACHE_FILE_NAME, DETAIL_CACHE_MAX_ENTRIES
+from sqlite_store import SQLiteStore, chunked
+
+# cache file location
+DETAIL_CACHE_FILE = (
+    Path(__file__).parent.parent / "data" / DETAIL_CACHE_FILE_NAME
+)
+
+# details table; the size bound is checked every 100 records written
+_store = SQLiteStore(
+    [
+        "CREATE TABLE IF NOT EXISTS details ("
+        "source TEXT NOT NULL, "
+        "record_id TEXT NOT NULL, "
+        "record TEXT NOT NULL, "
+        "last_access REAL NOT NULL, "
+        "PRIMARY KEY (source, record_id))",
+        "CREATE INDEX IF NOT EXISTS details_access "
+        "ON details (source, last_access)",
+    ],
+    maintenance_interval=100,
+)
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Get this thread's connection to the detail cache.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Open connection.
+    """
+    return _store.connect(DETAIL_CACHE_FILE)
+
+
+def get_detail(source: str, record_id: Any) -> dict[str, Any] | None:
+    """
+    Look up a cached detail record.
+
+    Parameters
+    ----------
+    source : str
+        Source name, e.g. "GBIF" or "WoRMS".
+    record_id : Any
+        Source identifier, e.g. a GBIF usageKey or WoRMS AphiaID.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        Cached record, or None if it has not been seen.
+    """
+    return get_details(source, [record_id]).get(record_id)
+
+
+def get_details(source: str, record_ids: list[Any]) -> dict[Any, dict]:
+    """
+    Look up many cached detail records.
+
+    Parameters
+    ----------
+    source : str
+        Source name, e.g. "GBIF" or "WoRMS".
+    record_ids : List[Any]
+        Source identifiers.
+
+    Returns
+    -------
+    Dict[Any, Dict[str, Any]]
+        Cached records keyed by the identifiers that were found.
+    """
+    if not record_ids:
+        return {}
+
+    try:
+        conn = _connect()
+        keys = {str(record_id): record_id for record_id in record_ids}
+        found = {}
+        for chunk in chunked(list(keys)):
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT record_id, record FROM details "
+                f"WHERE source = ? AND record_id IN ({placeholders})",
+                [source, *chunk],
+            ).fetchall()
+            for key, record in rows:
+                found[keys[key]] = json.loads(record)
+
+        if found:
+            conn.executemany(
+                "UPDATE details SET last_access = ? "
+                "WHERE source = ? AND record_id = ?",
+                [(time.time(), source, str(key)) for key in found],
+            )
+            conn.commit()
+        return found
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Detail cache error: {e}")
+        return {}
+
+
+def put_detail(source: str, record_id: Any, record: dict[str, Any]):
+    """
+    Store a detail record.
+
+    Parameters
+    ----------
+    source : str
+        Source name, e.g. "GBIF" or "WoRMS".
+    record_id : Any
+        Source identifier, e.g. a GBIF usageKey or WoRMS AphiaID.
+    record : Dict[str, Any]
+        Detail record as returned by the source.
+    """
+    put_details(source, {record_id: record})
+
+
+def put_details(source: str, records: dict[Any, dict[str, Any]]):
+    """
+    Store many detail records.
+
+    Parameters
+    ----------
+    source : str
+        Source name, e.g. "GBIF" or "WoRMS".
+    records : Dict[Any, Dict[str, Any]]
+        Detail records keyed by source identifier.
+    """
+    if not records:
+        return
+
+    try:
+        conn = _connect()
+        now = time.time()
+        conn.executemany(
+            "INSERT OR REPLACE INTO details "
+            "(source, record_id, record, last_access) VALUES (?, ?, ?, ?)",
+            [
+                (source, str(record_id), json.dumps(record), now)
+                for record_id, record in records.items()
+            ],
+        )
+        conn.commit()
+
+        if _store.count_writes(len(records)):
+            _evict(conn, source)
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        print(f"Detail cache error: {e}")
+
+
+def _evict(conn: sqlite3.Connection, source: str):
+    """
+    Drop the least recently used records beyond the size bound.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Open connection.
+    source : str
+        Source whose records are bounded.
+    """
+    conn.execute(
+        "DELETE FROM details WHERE source = ? AND record_id IN ("
+        "SELECT record_id FROM details WHERE source = ? "
+        "ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+        (source, source, DETAIL_CACHE_MAX_ENTRIES),
+    )
+    conn.commit()
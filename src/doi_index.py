@@ -0,0 +1,129 @@
+"""
+Persistent index of references already resolved to a DOI through CrossRef.
+
+Species of one genus are often described in the same publication, so the
+same reference string reaches query_crossref many times. References are
+keyed by a fingerprint that ignores case, accents, punctuation and spacing,
+and the DOI and paper link found for them are kept in a SQLite file so
+that CrossRef is only asked once per publication.
+"""
+
+import hashlib
+import re
+import sqlite3
+import time
+import unicodedata
+from pathlib import Path
+
+from config_loader import DOI_INDEX_FILE_NAME
+from sqlite_store import SQLiteStore
+
+# index file location
+DOI_INDEX_FILE = Path(__file__).parent.parent / "data" / DOI_INDEX_FILE_NAME
+
+# DOI index table
+_store = SQLiteStore(
+    [
+        "CREATE TABLE IF NOT EXISTS doi_index ("
+        "fingerprint TEXT PRIMARY KEY, "
+        "reference TEXT NOT NULL, "
+        "doi TEXT NOT NULL, "
+        "paper_link TEXT NOT NULL, "
+        "resolved_at REAL NOT NULL)"
+    ]
+)
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Get this thread's connection to the DOI index.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Open connection.
+    """
+    return _store.connect(DOI_INDEX_FILE)
+
+
+def reference_fingerprint(reference: str) -> str:
+    """
+    Compute a normalized fingerprint of a reference string.
+
+    Parameters
+    ----------
+    reference : str
+        Full reference as shown to the user.
+
+    Returns
+    -------
+    str
+        Hex digest of the reference with accents, case, punctuation and
+        spacing removed.
+    """
+    text = unicodedata.normalize("NFKD", reference)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    words = re.findall(r"\w+", text.lower())
+    return hashlib.sha1(" ".join(words).encode("utf-8")).hexdigest()
+
+
+def lookup(reference: str) -> dict[str, str] | None:
+    """
+    Find the DOI previously resolved for a reference.
+
+    Parameters
+    ----------
+    reference : str
+        Full reference.
+
+    Returns
+    -------
+    Optional[Dict[str, str]]
+        Dictionary with doi and paper_link, or None if not yet resolved.
+    """
+    try:
+        row = (
+            _connect()
+            .execute(
+                "SELECT doi, paper_link FROM doi_index WHERE fingerprint = ?",
+                (reference_fingerprint(reference),),
+            )
+            .fetchone()
+        )
+    except sqlite3.Error as e:
+        print(f"DOI index error: {e}")
+        return None
+
+    if row is None:
+        return None
+    return {"doi": row[0], "paper_link": row[1]}
+
+
+def store(reference: str, resolved: dict[str, str]):
+    """
+    Record the DOI resolved for a reference.
+
+    Parameters
+    ----------
+    reference : str
+        Full reference.
+    resolved : Dict[str, str]
+        Dictionary with doi and paper_link.
+    """
+    try:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO doi_index "
+            "(fingerprint, reference, doi, paper_link, resolved_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                reference_fingerprint(reference),
+                reference,
+                resolved["doi"],
+                resolved["paper_link"],
+                time.time(),
+            ),
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"DOI index error: {e}")
@@ -0,0 +1,272 @@
+"""
+Shared HTTP client for external taxonomic and bibliographic APIs.
+
+Requests are sent through one pooled, keep-alive session per host so that
+repeated queries reuse open connections instead of paying a new TCP and TLS
+handshake each time. Every request is rate limited per host, guarded by the
+host's circuit breaker, and carries the same identifying headers.
+Responses are stored in the response cache and replayed or revalidated
+from it (see response_cache). Throttled, failed and timed out requests are
+retried (see retry_policy); a host that keeps failing, answers with a
+server error or sends a body that cannot be decoded raises
+SourceUnavailableError, so callers can tell an unavailable source from a
+record that does not exist. A 404 or 410 answer means the record does not
+exist, and any other client error raises RequestRejectedError.
+"""
+
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import circuit_breaker
+import rate_limiter
+import response_cache
+import retry_policy
+from config_loader import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    PBDB_HEADERS,
+    RESPONSE_CACHE_ENABLED,
+    RETRY_MAX_ATTEMPTS,
+)
+
+# headers sent with every request; responses may be compressed
+HEADERS = {**PBDB_HEADERS, "Accept-Encoding": "gzip, deflate"}
+
+# one session per host, created on first use
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+# per-thread count of requests sent over the network
+_local = threading.local()
+
+# statuses meaning the requested record does not exist
+NOT_FOUND_STATUS = (404, 410)
+
+
+class SourceUnavailableError(requests.RequestException):
+    """Raised when a host keeps failing or answers with a server error."""
+
+
+class CircuitOpenError(SourceUnavailableError):
+    """Raised when a request is refused because the host's breaker is open."""
+
+
+class RequestRejectedError(requests.HTTPError):
+    """Raised when a host answers a request with a client error status."""
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Get the pooled session for the host of a URL.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+
+    Returns
+    -------
+    requests.Session
+        Keep-alive session shared by all requests to the host.
+    """
+    host = urlsplit(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def _send(
+    url: str, params: dict | None, timeout: float, headers: dict[str, str]
+) -> tuple[requests.Response, float]:
+    """
+    Send a request, retrying throttling, server and transport errors.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+    params : dict
+        Optional query parameters.
+    timeout : float
+        Request timeout in seconds.
+    headers : Dict[str, str]
+        Extra request headers.
+
+    Returns
+    -------
+    Tuple[requests.Response, float]
+        The first response that is not a retryable failure, and the
+        duration of the attempt that produced it in seconds.
+    """
+    session = get_session(url)
+    retry_policy.get_budget(url).record_request()
+    attempt = 0
+    while True:
+        attempt += 1
+        rate_limiter.acquire(url)
+        _local.sent = requests_sent() + 1
+        start = time.perf_counter()
+        try:
+            response = session.get(
+                url, params=params, timeout=timeout, headers=headers
+            )
+        except requests.RequestException as e:
+            # refused, reset and timed out connections and truncated bodies
+            error, retry_after = e, None
+        else:
+            if response.status_code not in retry_policy.RETRYABLE_STATUS:
+                return response, time.perf_counter() - start
+            error = f"HTTP {response.status_code}"
+            retry_after = response.headers.get("Retry-After")
+
+        delay = None
+        if attempt < RETRY_MAX_ATTEMPTS:
+            delay = retry_policy.retry_delay(url, attempt, retry_after)
+        if delay is None:
+            raise SourceUnavailableError(
+                f"{urlsplit(url).netloc} unavailable after {attempt} "
+                f"attempts: {error}"
+            )
+        time.sleep(delay)
+
+
+def requests_sent() -> int:
+    """
+    Count the requests this thread has sent over the network.
+
+    Responses replayed from the response cache are not counted, so
+    comparing counts around a call tells whether it reached any host.
+
+    Returns
+    -------
+    int
+        Number of requests sent, including retries.
+    """
+    return getattr(_local, "sent", 0)
+
+
+def get(
+    url: str,
+    params: dict | None = None,
+    timeout: float | None = None,
+    use_cache: bool = True,
+) -> requests.Response:
+    """
+    Send a rate-limited GET request over the pooled session for its host.
+
+    A fresh stored response is returned without a request. A stale one is
+    revalidated with a conditional request and returned if the server
+    answers 304 Not Modified. Requests to a host whose circuit breaker is
+    open are refused with CircuitOpenError, and requests that still fail
+    after all retries or are answered with a server error raise
+    SourceUnavailableError. Client errors other than NOT_FOUND_STATUS
+    raise RequestRejectedError; both count as failures for the breaker.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+    params : dict
+        Optional query parameters.
+    timeout : float
+        Request timeout in seconds; by default adapted to the host's
+        recent latencies.
+    use_cache : bool
+        Whether to use the response cache.
+
+    Returns
+    -------
+    requests.Response
+        The successful or NOT_FOUND_STATUS response.
+    """
+    use_cache = use_cache and RESPONSE_CACHE_ENABLED
+    key = response_cache.make_key(url, params)
+    cached = response_cache.get(key) if use_cache else None
+    if cached is not None and cached.is_fresh:
+        return cached.to_response()
+
+    breaker = circuit_breaker.get_breaker(url)
+    if not breaker.allow_request():
+        raise CircuitOpenError(f"Circuit open for {breaker.host}")
+    if timeout is None:
+        timeout = breaker.timeout()
+
+    headers = cached.validators() if cached is not None else {}
+    host = urlsplit(url).netloc
+    try:
+        response, latency = _send(url, params, timeout, headers)
+        status = response.status_code
+        if status >= 500:
+            raise SourceUnavailableError(f"{host} answered HTTP {status}")
+        # a missing record is an answer; other client errors are failures
+        if status // 100 == 4 and status not in NOT_FOUND_STATUS:
+            raise RequestRejectedError(
+                f"{host} rejected the request with HTTP {status}",
+                response=response,
+            )
+    except Exception:
+        breaker.record_failure()
+        raise
+    breaker.record_success(latency)
+
+    if cached is not None and status == 304:
+        response_cache.touch(key)
+        return cached.to_response()
+    if use_cache:
+        response_cache.put(key, response)
+    return response
+
+
+def get_json(url: str, params: dict | None = None) -> Any:
+    """
+    Send a GET request with get and decode its JSON body.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+    params : dict
+        Optional query parameters.
+
+    Returns
+    -------
+    Any
+        Decoded body, or None if the host answered that the record does
+        not exist or with no content.
+    """
+    response = get(url, params=params)
+    if (
+        response.status_code in NOT_FOUND_STATUS
+        or response.status_code == 204
+        or not response.content
+    ):
+        return None
+    try:
+        return response.json()
+    except ValueError as e:
+        raise SourceUnavailableError(
+            f"{urlsplit(url).netloc} sent invalid JSON: {e}"
+        ) from e
+
+
+def close_sessions():
+    """Close all pooled sessions and their connections."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,192 @@
+"""
+Canonical forms of scientific names as typed by users.
+
+The same taxon is often entered in different ways: with extra spaces, in
+another case, with its authority ("Enchodus petrosus Cope, 1874"), with
+a subgenus ("Enchodus (Enchodus) petrosus"), with an open nomenclature
+qualifier ("Enchodus cf. petrosus"), with an infraspecific rank marker
+("Aus bus subsp. cus") or with accented or full-width characters. All of
+these reduce to one canonical name, which is what is searched and
+cached.
+"""
+
+import re
+import unicodedata
+
+# open nomenclature qualifiers and rank markers dropped from names; the
+# forms without a period are only dropped where they cannot be an epithet
+QUALIFIERS = {"?", "cf.", "aff.", "sp.", "spp."}
+BARE_QUALIFIERS = {"cf", "aff", "sp", "spp"}
+
+# infraspecific rank markers, dropped while the epithet after them is kept
+RANK_MARKERS = {"subsp.", "ssp.", "var.", "f."}
+
+# lowercase particles that start an authority, e.g. "De Kay" as "de Kay"
+AUTHORITY_PARTICLES = {
+    "d'",
+    "da",
+    "de",
+    "del",
+    "della",
+    "der",
+    "di",
+    "du",
+    "la",
+    "le",
+    "van",
+    "von",
+}
+
+# species and subspecies epithets after the genus
+MAX_EPITHETS = 2
+
+# an epithet once lowercased: letters, digits and hyphens, with a letter
+_EPITHET = re.compile(r"(?=[a-z0-9-]*[a-z])[a-z0-9]+(?:-[a-z0-9]+)*")
+
+# a subgenus in parentheses
+_SUBGENUS = re.compile(r"\([A-Za-z]+\)")
+
+# a year of an authority, possibly with a letter suffix or a bracket
+_YEAR = re.compile(r"\[?\d{4}[a-z]?\]?\)?[,;.]?")
+
+# an initial of an author's given name, e.g. "E." or "J.-B."
+_INITIAL = re.compile(r"[A-Z][a-z]?\.(?:-?[A-Z][a-z]?\.)*")
+
+
+def _clean_text(name: str) -> str:
+    """
+    Unicode-normalize a name and drop accents.
+
+    Parameters
+    ----------
+    name : str
+        Name as entered.
+
+    Returns
+    -------
+    str
+        Name in NFKC form without combining marks.
+    """
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return unicodedata.normalize("NFKC", text)
+
+
+def _is_authority(tokens: list[str], position: int) -> bool:
+    """
+    Check whether a token clearly starts the authority of a name.
+
+    Parameters
+    ----------
+    tokens : List[str]
+        Tokens of the name.
+    position : int
+        Index of the token to check.
+
+    Returns
+    -------
+    bool
+        True for a year, an initial, a parenthesized authority, a
+        particle before a capitalized word, or a capitalized word ending
+        in a comma or followed by a year or an initial.
+    """
+    token = tokens[position]
+    following = tokens[position + 1] if position + 1 < len(tokens) else ""
+    if _YEAR.fullmatch(token) or _INITIAL.fullmatch(token):
+        return True
+    if token.startswith("(") and not _SUBGENUS.fullmatch(token):
+        return True
+    if token in AUTHORITY_PARTICLES:
+        return following[:1].isupper()
+    if not token[:1].isupper():
+        return False
+    return (
+        token.endswith(",")
+        or bool(_YEAR.fullmatch(following))
+        or bool(_INITIAL.fullmatch(following))
+    )
+
+
+def canonical_name(name: str) -> str:
+    """
+    Reduce a scientific name to its canonical form.
+
+    The genus is capitalized and followed by at most two lowercase
+    epithets, matched case-insensitively. Whitespace is collapsed, accents
+    are removed, and any subgenus, cf./aff./sp. qualifier, rank marker
+    (subsp., ssp., var., f.) and trailing authority are dropped. Only a
+    clear authority ends the name early: a year, an initial, a
+    parenthesized authority, a capitalized word ending in a comma or
+    followed by a year or an initial, or a capitalized word after a
+    lowercase epithet.
+
+    Parameters
+    ----------
+    name : str
+        Name as entered, e.g. "enchodus  (Enchodus) petrosus Cope, 1874".
+
+    Returns
+    -------
+    str
+        Canonical name, e.g. "Enchodus petrosus", or "" for a blank name.
+    """
+    text = _clean_text(name)
+    # names typed in capitals carry no case information
+    if not any(c.islower() for c in text):
+        text = text.lower()
+
+    tokens = text.split()
+    if not tokens:
+        return ""
+
+    genus = tokens[0]
+    epithets = []
+    # whether an epithet was typed in lowercase, as names are written
+    cased = False
+    for position in range(1, len(tokens)):
+        token = tokens[position]
+        lowered = token.lower()
+        if lowered in QUALIFIERS or lowered in RANK_MARKERS:
+            continue
+        if lowered in BARE_QUALIFIERS:
+            following = tokens[position + 1 : position + 2]
+            if not following:
+                # a bare trailing qualifier, e.g. "Enchodus sp"
+                break
+            if _EPITHET.fullmatch(following[0]) and not _is_authority(
+                tokens, position + 1
+            ):
+                # a qualifier before an epithet, e.g. "Enchodus cf petrosus"
+                continue
+        if not epithets and _SUBGENUS.fullmatch(token):
+            continue
+        if (
+            len(epithets) >= MAX_EPITHETS
+            or _is_authority(tokens, position)
+            # an author without a year after a properly cased epithet
+            or (cased and token[:1].isupper())
+            or not _EPITHET.fullmatch(lowered)
+        ):
+            # the authority and anything after it
+            break
+        epithets.append(lowered)
+        cased = cased or token == lowered
+
+    return " ".join([genus[:1].upper() + genus[1:].lower(), *epithets])
+
+
+def canonical_key(name: str) -> str:
+    """
+    Get the lookup key of a scientific name.
+
+    Parameters
+    ----------
+    name : str
+        Name as entered or stored.
+
+    Returns
+    -------
+    str
+        Lowercase canonical name.
+    """
+    return canonical_name(name).lower()
@@ -0,0 +1,113 @@
+"""
+Location and column expressions of the local PBDB taxonomy table.
+
+Shared by the query code in database_queries and the offline build tool
+build_pbdb_taxonomy, which imports only this module so that a build does
+not load the HTTP clients and caches of the app.
+"""
+
+from pathlib import Path
+
+import polars as pl
+
+from config_loader import NOT_AVAILABLE
+
+# local PBDB taxonomy table
+PBDB_FILE = (
+    Path(__file__).parent.parent
+    / "data"
+    / "pbdb_essential_taxonomy_with_refs.parquet"
+)
+
+# 4-digit publication years between 1700 and 2029
+YEAR_PATTERN = r"\b(1[7-9]\d{2}|20[0-2]\d)\b"
+
+
+def pbdb_name_key_expr(table: pl.DataFrame) -> pl.Expr:
+    """
+    Build a polars expression for the lowercase lookup key of PBDB names.
+
+    Parameters
+    ----------
+    table : pl.DataFrame
+        PBDB table; a precomputed "name_key" column is used if present.
+
+    Returns
+    -------
+    pl.Expr
+        Lowercase taxon names.
+    """
+    if "name_key" in table.columns:
+        return pl.col("name_key")
+    return pl.col("nam").str.to_lowercase()
+
+
+def pbdb_year_expr(authority: pl.Expr) -> pl.Expr:
+    """
+    Build a polars expression matching extract_year on authorities.
+
+    Parameters
+    ----------
+    authority : pl.Expr
+        Authority strings like "Cope, 1874".
+
+    Returns
+    -------
+    pl.Expr
+        Extracted years.
+    """
+    return (
+        pl.when(authority == NOT_AVAILABLE)
+        .then(None)
+        .otherwise(authority.str.extract(YEAR_PATTERN, 1).cast(pl.Int64))
+    )
+
+
+def pbdb_author_expr(authority: pl.Expr, reference: pl.Expr) -> pl.Expr:
+    """
+    Build a polars expression for PBDB authors, as in query_pbdb_local.
+
+    The author is extracted from the authority like extract_author does,
+    falling back to the first sentence of the reference.
+
+    Parameters
+    ----------
+    authority : pl.Expr
+        Authority strings like "Cope, 1874" or "(Cope, 1874)".
+    reference : pl.Expr
+        Full reference strings like "E. D. Cope. 1874. ...".
+
+    Returns
+    -------
+    pl.Expr
+        Extracted author names.
+    """
+    author = (
+        authority.str.replace_all(r"[()]", "")
+        .str.extract_all(r"\S+")
+        .list.eval(
+            pl.element()
+            # skip tokens that look like a year
+            .filter(~pl.element().str.contains(r"^\d{4}$"))
+            .str.strip_chars_end(",")
+        )
+        .list.join(" ")
+    )
+    author = (
+        pl.when(authority.is_null() | (authority == NOT_AVAILABLE))
+        .then(pl.lit(NOT_AVAILABLE))
+        .when(author.is_null() | (author == ""))
+        .then(pl.lit(NOT_AVAILABLE))
+        .otherwise(author)
+    )
+
+    # fall back to the first sentence of the reference
+    return (
+        pl.when(
+            (author == NOT_AVAILABLE)
+            & reference.is_not_null()
+            & (reference != NOT_AVAILABLE)
+        )
+        .then(reference.str.split(".").list.first().str.strip_chars())
+        .otherwise(author)
+    )
@@ -0,0 +1,211 @@
+"""
+Per-host token-bucket rate limiting for external API requests.
+
+Each remote host gets a bucket that refills at a configured rate up to a
+burst size. The bucket state is kept in a small file under a shared
+directory and updated under an advisory file lock, so every thread and
+process using the same data directory draws from the same bucket.
+"""
+
+import contextlib
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from config_loader import RATE_LIMIT_STATE_DIR_NAME, RATE_LIMITS
+
+# directory holding the shared bucket state for each host
+STATE_DIR = Path(__file__).parent.parent / "data" / RATE_LIMIT_STATE_DIR_NAME
+
+# bucket state on disk: current token level and time of last update
+_STATE_FORMAT = "dd"
+
+
+class TokenBucket:
+    """
+    Token bucket shared by all threads and, where possible, processes.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second.
+    burst : float
+        Maximum number of tokens the bucket can hold.
+    state_file : Path
+        Optional file holding the bucket state for cross-process use. If
+        None, or if file locking is unavailable, the bucket is only shared
+        within this process.
+    """
+
+    def __init__(self, rate: float, burst: float, state_file=None):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.state_file = state_file if fcntl is not None else None
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.time()
+
+    @contextlib.contextmanager
+    def _state(self):
+        """
+        Hold the bucket state for reading and updating.
+
+        Yields
+        ------
+        List[float]
+            Mutable [tokens, updated] pair written back on exit.
+        """
+        with self._lock:
+            # without fcntl state_file is always None; both checked for typing
+            if self.state_file is None or fcntl is None:
+                state = [self._tokens, self._updated]
+                yield state
+                self._tokens, self._updated = state
+                return
+
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.pread(fd, struct.calcsize(_STATE_FORMAT), 0)
+                if len(raw) == struct.calcsize(_STATE_FORMAT):
+                    state = list(struct.unpack(_STATE_FORMAT, raw))
+                else:
+                    state = [self.burst, time.time()]
+                yield state
+                os.pwrite(fd, struct.pack(_STATE_FORMAT, *state), 0)
+            finally:
+                os.close(fd)
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket if they are available.
+
+        Parameters
+        ----------
+        tokens : float
+            Number of tokens to take.
+
+        Returns
+        -------
+        float
+            0.0 if the tokens were taken, otherwise the number of seconds
+            to wait before they will be available.
+        """
+        with self._state() as state:
+            now = time.time()
+            elapsed = max(0.0, now - state[1])
+            level = min(self.burst, state[0] + elapsed * self.rate)
+            state[1] = now
+            if level >= tokens:
+                state[0] = level - tokens
+                return 0.0
+            state[0] = level
+            return (tokens - level) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until tokens are available, then take them.
+
+        Parameters
+        ----------
+        tokens : float
+            Number of tokens to take.
+
+        Returns
+        -------
+        float
+            Total seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+
+# one bucket per configured host, created on first use
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _configured_host(host: str) -> str | None:
+    """
+    Find the configured host entry that covers a request host.
+
+    Parameters
+    ----------
+    host : str
+        Host name from a request URL, e.g. "www.marinespecies.org".
+
+    Returns
+    -------
+    Optional[str]
+        Matching key in the rate limit configuration, or None.
+    """
+    for configured in RATE_LIMITS:
+        if host == configured or host.endswith(f".{configured}"):
+            return configured
+    return None
+
+
+def get_bucket(url: str) -> TokenBucket | None:
+    """
+    Get the token bucket for the host of a URL.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+
+    Returns
+    -------
+    Optional[TokenBucket]
+        Bucket for the host, or None if the host is not rate limited.
+    """
+    host = urlsplit(url).hostname or ""
+    configured = _configured_host(host)
+    if configured is None:
+        return None
+
+    with _buckets_lock:
+        bucket = _buckets.get(configured)
+        if bucket is None:
+            limits = RATE_LIMITS[configured]
+            bucket = TokenBucket(
+                limits["rate"],
+                limits["burst"],
+                state_file=STATE_DIR / f"{configured}.bucket",
+            )
+            _buckets[configured] = bucket
+        return bucket
+
+
+def acquire(url: str) -> float:
+    """
+    Wait for permission to send a request to the host of a URL.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+
+    Returns
+    -------
+    float
+        Seconds spent waiting (0.0 for hosts without a limit).
+    """
+    bucket = get_bucket(url)
+    if bucket is None:
+        return 0.0
+    return bucket.acquire()
@@ -0,0 +1,319 @@
+"""
+On-disk cache of raw HTTP responses from external sources.
+
+Responses are stored compressed in a SQLite file, keyed by URL and query
+parameters. Entries younger than the configured maximum age are replayed
+without touching the network, so re-deriving results after a change to the
+reconciliation logic is limited by local CPU rather than upstream APIs.
+Older entries are revalidated with If-None-Match / If-Modified-Since, and
+the total size is bounded by evicting the least recently used responses.
+"""
+
+import json
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config_loader import (
+    RESPONSE_CACHE_FILE_NAME,
+    RESPONSE_CACHE_MAX_AGE,
+    RESPONSE_CACHE_MAX_BYTES,
+)
+from sqlite_store import SQLiteStore
+
+# cache file location
+RESPONSE_CACHE_FILE = (
+    Path(__file__).parent.parent / "data" / RESPONSE_CACHE_FILE_NAME
+)
+
+# status codes worth replaying (204 is WoRMS' "no match")
+CACHEABLE_STATUS = (200, 204)
+
+# headers that describe the transfer rather than the decoded body
+_DROPPED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "transfer-encoding",
+}
+
+# responses table; the size bound is checked every 50 writes
+_store = SQLiteStore(
+    [
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, "
+        "url TEXT NOT NULL, "
+        "status INTEGER NOT NULL, "
+        "headers TEXT NOT NULL, "
+        "body BLOB NOT NULL, "
+        "size INTEGER NOT NULL, "
+        "stored_at REAL NOT NULL, "
+        "last_access REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS responses_access "
+        "ON responses (last_access)",
+    ],
+    maintenance_interval=50,
+)
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Get this thread's connection to the response cache.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Open connection.
+    """
+    return _store.connect(RESPONSE_CACHE_FILE)
+
+
+def make_key(url: str, params: dict[str, Any] | None = None) -> str:
+    """
+    Build the cache key for a GET request.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+    params : Dict[str, Any]
+        Optional query parameters; list values are repeated keys.
+
+    Returns
+    -------
+    str
+        URL with the parameters in a canonical order.
+    """
+    if not params:
+        return url
+    items = []
+    for name in sorted(params):
+        value = params[name]
+        values = value if isinstance(value, list | tuple) else [value]
+        items.extend((name, str(v)) for v in values)
+    return f"{url}?{urlencode(items)}"
+
+
+class ReplayedResponse(requests.Response):
+    """Response rebuilt from the cache instead of received from the host."""
+
+    from_cache = True
+
+
+class CachedResponse:
+    """
+    A stored response and its freshness.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+    status : int
+        HTTP status code.
+    headers : Dict[str, str]
+        Response headers describing the body.
+    body : bytes
+        Decoded response body.
+    stored_at : float
+        Time the response was stored or last revalidated.
+    """
+
+    def __init__(self, url, status, headers, body, stored_at):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the response can be replayed without revalidation."""
+        return time.time() - self.stored_at < RESPONSE_CACHE_MAX_AGE
+
+    def validators(self) -> dict[str, str]:
+        """
+        Get the conditional request headers for revalidating this response.
+
+        Returns
+        -------
+        Dict[str, str]
+            If-None-Match and/or If-Modified-Since headers.
+        """
+        headers = {}
+        lowered = {name.lower(): value for name, value in self.headers.items()}
+        if "etag" in lowered:
+            headers["If-None-Match"] = lowered["etag"]
+        if "last-modified" in lowered:
+            headers["If-Modified-Since"] = lowered["last-modified"]
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """
+        Rebuild a requests Response from the stored data.
+
+        Returns
+        -------
+        requests.Response
+            Response whose from_cache attribute is True.
+        """
+        response = ReplayedResponse()
+        response.status_code = self.status
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.encoding = requests.utils.get_encoding_from_headers(
+            response.headers
+        )
+        return response
+
+
+def get(key: str) -> CachedResponse | None:
+    """
+    Look up a stored response.
+
+    Parameters
+    ----------
+    key : str
+        Cache key from make_key.
+
+    Returns
+    -------
+    Optional[CachedResponse]
+        Stored response, or None if there is none.
+    """
+    try:
+        conn = _connect()
+        row = conn.execute(
+            "SELECT url, status, headers, body, stored_at FROM responses "
+            "WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        conn.execute(
+            "UPDATE responses SET last_access = ? WHERE key = ?",
+            (time.time(), key),
+        )
+        conn.commit()
+        url, status, headers, body, stored_at = row
+        return CachedResponse(
+            url, status, json.loads(headers), zlib.decompress(body), stored_at
+        )
+    except (sqlite3.Error, ValueError, zlib.error) as e:
+        print(f"Response cache error: {e}")
+        return None
+
+
+def put(key: str, response: requests.Response):
+    """
+    Store a response if its status is cacheable.
+
+    Parameters
+    ----------
+    key : str
+        Cache key from make_key.
+    response : requests.Response
+        Response to store.
+    """
+    if response.status_code not in CACHEABLE_STATUS:
+        return
+
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name.lower() not in _DROPPED_HEADERS
+    }
+    body = zlib.compress(response.content)
+    now = time.time()
+    try:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, url, status, headers, body, size, stored_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                response.url,
+                response.status_code,
+                json.dumps(headers),
+                body,
+                len(body),
+                now,
+                now,
+            ),
+        )
+        conn.commit()
+
+        if _store.count_writes():
+            _evict(conn)
+    except sqlite3.Error as e:
+        print(f"Response cache error: {e}")
+
+
+def touch(key: str):
+    """
+    Mark a stored response as revalidated, restarting its maximum age.
+
+    Parameters
+    ----------
+    key : str
+        Cache key from make_key.
+    """
+    try:
+        conn = _connect()
+        now = time.time()
+        conn.execute(
+            "UPDATE responses SET stored_at = ?, last_access = ? "
+            "WHERE key = ?",
+            (now, now, key),
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"Response cache error: {e}")
+
+
+def _evict(conn: sqlite3.Connection):
+    """
+    Drop the least recently used responses beyond the size bound.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Open connection.
+    """
+    (total,) = conn.execute(
+        "SELECT COALESCE(SUM(size), 0) FROM responses"
+    ).fetchone()
+    if total <= RESPONSE_CACHE_MAX_BYTES:
+        return
+
+    excess = total - RESPONSE_CACHE_MAX_BYTES
+    freed = 0
+    stale = []
+    for key, size in conn.execute(
+        "SELECT key, size FROM responses ORDER BY last_access"
+    ):
+        stale.append((key,))
+        freed += size
+        if freed >= excess:
+            break
+    conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+    conn.commit()
+
+
+def clear():
+    """Remove every stored response."""
+    try:
+        conn = _connect()
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"Response cache error: {e}")
@@ -0,0 +1,196 @@
+"""
+Retry policy for transient failures of external API requests.
+
+Throttling (429) and server errors (5xx) are usually transient, so a
+request that fails with one is retried after a delay. Delays grow
+exponentially with full jitter, so clients that were throttled together do
+not retry together, and a Retry-After header from the server takes
+precedence. Each host has a retry budget: retries may only make up a set
+share of recent requests, so a host that is down is not hammered with
+retries on top of regular traffic.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from config_loader import (
+    RETRY_BASE_DELAY,
+    RETRY_BUDGET_MIN_RETRIES,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_WINDOW,
+    RETRY_MAX_AFTER,
+    RETRY_MAX_DELAY,
+)
+
+# status codes worth retrying
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Get the delay before a retry, with exponential growth and full jitter.
+
+    Parameters
+    ----------
+    attempt : int
+        Number of attempts made so far (1 for the first retry).
+
+    Returns
+    -------
+    float
+        Delay in seconds.
+    """
+    ceiling = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling)
+
+
+def retry_after_delay(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header.
+
+    Parameters
+    ----------
+    value : str
+        Header value: a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    Optional[float]
+        Delay in seconds, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class RetryBudget:
+    """
+    Limit on the share of recent requests to a host that may be retries.
+
+    Parameters
+    ----------
+    ratio : float
+        Retries allowed per request sent within the window.
+    min_retries : int
+        Retries always allowed within the window.
+    window : float
+        Length of the window in seconds.
+    """
+
+    def __init__(self, ratio, min_retries, window):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self.requests = deque()
+        self.retries = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float):
+        """Drop events older than the window. Call with _lock held."""
+        for events in (self.requests, self.retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def record_request(self):
+        """Record a first attempt of a request."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self.requests.append(now)
+
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget if any is left.
+
+        Returns
+        -------
+        bool
+            True if the retry may be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            allowed = self.min_retries + self.ratio * len(self.requests)
+            if len(self.retries) >= allowed:
+                return False
+            self.retries.append(now)
+            return True
+
+
+# one budget per host, created on first use
+_budgets: dict[str, RetryBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_budget(url: str) -> RetryBudget:
+    """
+    Get the retry budget for the host of a URL.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+
+    Returns
+    -------
+    RetryBudget
+        Budget shared by all requests to the host.
+    """
+    host = urlsplit(url).netloc
+    with _budgets_lock:
+        budget = _budgets.get(host)
+        if budget is None:
+            budget = RetryBudget(
+                RETRY_BUDGET_RATIO,
+                RETRY_BUDGET_MIN_RETRIES,
+                RETRY_BUDGET_WINDOW,
+            )
+            _budgets[host] = budget
+        return budget
+
+
+def retry_delay(
+    url: str, attempt: int, retry_after: str | None = None
+) -> float | None:
+    """
+    Decide whether and when to retry a failed request.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+    attempt : int
+        Number of attempts made so far.
+    retry_after : str
+        Retry-After header of the failed response, if any.
+
+    Returns
+    -------
+    Optional[float]
+        Seconds to wait before retrying, or None if the request should not
+        be retried (the server asked for a longer wait than allowed, or
+        the host's retry budget is spent).
+    """
+    delay = retry_after_delay(retry_after)
+    if delay is None:
+        delay = backoff_delay(attempt)
+    elif delay > RETRY_MAX_AFTER:
+        return None
+
+    if not get_budget(url).try_spend():
+        return None
+    return delay
@@ -0,0 +1,82 @@
+"""
+Coalescing of concurrent identical calls within one process.
+
+When several callers ask for the same key at once, only the first (the
+leader) does the work; the others wait for it and share its result. All
+Streamlit sessions run in the same process, so this keeps simultaneous
+searches for the same species from each querying every database and then
+each writing a row to the cache.
+"""
+
+import threading
+from typing import Any
+
+
+class Flight:
+    """An in-progress call that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+    def wait(self) -> Any:
+        """
+        Wait for the leader to finish.
+
+        Returns
+        -------
+        Any
+            The leader's result, or None if it gave up or failed.
+        """
+        self.done.wait()
+        return self.result
+
+
+class SingleFlight:
+    """Registry of in-progress calls keyed by what they compute."""
+
+    def __init__(self):
+        self._flights: dict[Any, Flight] = {}
+        self._lock = threading.Lock()
+
+    def join(self, key: Any) -> tuple[Flight, bool]:
+        """
+        Join the in-progress call for a key, or start one.
+
+        Parameters
+        ----------
+        key : Any
+            Hashable key identifying the call.
+
+        Returns
+        -------
+        Tuple[Flight, bool]
+            The flight, and whether the caller is its leader and must
+            call finish when done.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = Flight()
+            self._flights[key] = flight
+            return flight, True
+
+    def finish(self, key: Any, flight: Flight, result: Any):
+        """
+        Publish the leader's result and release the waiting callers.
+
+        Parameters
+        ----------
+        key : Any
+            Key passed to join.
+        flight : Flight
+            Flight returned by join.
+        result : Any
+            Result to share, or None if the leader gave up.
+        """
+        flight.result = result
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.done.set()
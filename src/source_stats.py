@@ -0,0 +1,432 @@
+"""
+Per-source hit rate, reference win rate and latency statistics.
+
+Every database query records whether the source returned anything, how
+long it took, and whether its reference was the one chosen for the final
+result. Statistics are kept per taxonomic group (the genus of the searched
+name) and overall, and their increments are added to a SQLite file shared
+by all processes so they survive restarts. search_taxonomy uses them to
+skip sources that almost never answer for a group, or that are slow and
+almost never supply the chosen reference, while still probing skipped
+sources now and then so the statistics stay current.
+"""
+
+import atexit
+import json
+import random
+import sqlite3
+import threading
+from collections import deque
+from pathlib import Path
+
+from config_loader import (
+    SOURCE_STATS_ADAPTIVE,
+    SOURCE_STATS_EXPLORE_RATE,
+    SOURCE_STATS_FILE_NAME,
+    SOURCE_STATS_LATENCY_WINDOW,
+    SOURCE_STATS_MIN_HIT_RATE,
+    SOURCE_STATS_MIN_SAMPLES,
+    SOURCE_STATS_MIN_WIN_RATE,
+    SOURCE_STATS_SLOW_LATENCY,
+)
+
+# statistics file location
+SOURCE_STATS_FILE = (
+    Path(__file__).parent.parent / "data" / SOURCE_STATS_FILE_NAME
+)
+
+# group holding statistics across all taxa
+ALL_TAXA = "*"
+
+# how many updates between saves to disk
+_FLUSH_INTERVAL = 25
+
+
+class SourceStats:
+    """
+    Running statistics for one source within one group.
+
+    Parameters
+    ----------
+    queries : int
+        Number of queries recorded.
+    hits : int
+        Number of queries that returned a result.
+    wins : int
+        Number of searches where this source's reference was chosen.
+    latencies : List[float]
+        Most recent query latencies in seconds.
+    """
+
+    def __init__(self, queries=0, hits=0, wins=0, latencies=()):
+        self.queries = queries
+        self.hits = hits
+        self.wins = wins
+        self.latencies: deque[float] = deque(
+            latencies, maxlen=SOURCE_STATS_LATENCY_WINDOW
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of queries that returned a result."""
+        return self.hits / self.queries if self.queries else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Share of queries whose reference was chosen."""
+        return self.wins / self.queries if self.queries else 0.0
+
+    def latency_percentile(self, q: float) -> float | None:
+        """
+        Get a percentile of the recent latencies.
+
+        Parameters
+        ----------
+        q : float
+            Percentile between 0 and 100.
+
+        Returns
+        -------
+        Optional[float]
+            Latency in seconds, or None if nothing was recorded.
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+# statistics keyed by (group, source), loaded on first use, and the
+# increments recorded since they were last saved
+_stats: dict[tuple[str, str], SourceStats] = {}
+_pending: dict[tuple[str, str], SourceStats] = {}
+_loaded = False
+_updates = 0
+_lock = threading.Lock()
+
+
+def taxon_group(species_name: str) -> str:
+    """
+    Get the taxonomic group used to keep statistics for a name.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name.
+
+    Returns
+    -------
+    str
+        Lowercase genus, or ALL_TAXA for an empty name.
+    """
+    parts = species_name.strip().lower().split()
+    return parts[0] if parts else ALL_TAXA
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Open the statistics file, creating the table.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Open connection.
+    """
+    SOURCE_STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(SOURCE_STATS_FILE, timeout=30)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS source_stats ("
+        "grp TEXT NOT NULL, "
+        "source TEXT NOT NULL, "
+        "queries INTEGER NOT NULL, "
+        "hits INTEGER NOT NULL, "
+        "wins INTEGER NOT NULL, "
+        "latencies TEXT NOT NULL, "
+        "PRIMARY KEY (grp, source))"
+    )
+    return conn
+
+
+def _ensure_loaded():
+    """Load saved statistics into memory once. Call with _lock held."""
+    global _loaded
+
+    if _loaded:
+        return
+    _loaded = True
+    # nothing saved yet; the file is created by the first flush
+    if not SOURCE_STATS_FILE.exists():
+        return
+    try:
+        conn = _connect()
+        try:
+            for grp, source, queries, hits, wins, latencies in conn.execute(
+                "SELECT grp, source, queries, hits, wins, latencies "
+                "FROM source_stats"
+            ):
+                _stats[(grp, source)] = SourceStats(
+                    queries, hits, wins, json.loads(latencies)
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Source stats error: {e}")
+
+
+def _get(group: str, source: str) -> SourceStats:
+    """
+    Get the statistics for a group and source. Call with _lock held.
+
+    Parameters
+    ----------
+    group : str
+        Taxonomic group.
+    source : str
+        Source name.
+
+    Returns
+    -------
+    SourceStats
+        Statistics, created empty if missing.
+    """
+    key = (group, source)
+    if key not in _stats:
+        _stats[key] = SourceStats()
+    return _stats[key]
+
+
+def _get_pending(group: str, source: str) -> SourceStats:
+    """
+    Get the unsaved increments for a group and source. Call with _lock held.
+
+    Parameters
+    ----------
+    group : str
+        Taxonomic group.
+    source : str
+        Source name.
+
+    Returns
+    -------
+    SourceStats
+        Increments since the last save, created empty if missing.
+    """
+    key = (group, source)
+    if key not in _pending:
+        _pending[key] = SourceStats()
+    return _pending[key]
+
+
+def _updated():
+    """Count an update and save statistics periodically. Call with _lock."""
+    global _updates
+
+    _updates += 1
+    if _updates >= _FLUSH_INTERVAL:
+        _flush()
+
+
+def _flush():
+    """
+    Add unsaved increments to the statistics file. Call with _lock held.
+
+    Counts are added to the saved ones rather than replacing them, so
+    processes sharing the file do not overwrite each other's counts, and
+    the saved totals are read back into memory.
+    """
+    global _updates
+
+    _updates = 0
+    if not _pending:
+        return
+    saved = {}
+    try:
+        conn = _connect()
+        try:
+            # one write transaction, so latency windows merge consistently
+            conn.execute("BEGIN IMMEDIATE")
+            for key, delta in _pending.items():
+                row = conn.execute(
+                    "SELECT latencies FROM source_stats "
+                    "WHERE grp = ? AND source = ?",
+                    key,
+                ).fetchone()
+                latencies: deque[float] = deque(
+                    json.loads(row[0]) if row else (),
+                    maxlen=SOURCE_STATS_LATENCY_WINDOW,
+                )
+                latencies.extend(delta.latencies)
+                conn.execute(
+                    "INSERT INTO source_stats "
+                    "(grp, source, queries, hits, wins, latencies) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (grp, source) DO UPDATE SET "
+                    "queries = queries + excluded.queries, "
+                    "hits = hits + excluded.hits, "
+                    "wins = wins + excluded.wins, "
+                    "latencies = excluded.latencies",
+                    (
+                        *key,
+                        delta.queries,
+                        delta.hits,
+                        delta.wins,
+                        json.dumps(list(latencies)),
+                    ),
+                )
+                queries, hits, wins = conn.execute(
+                    "SELECT queries, hits, wins FROM source_stats "
+                    "WHERE grp = ? AND source = ?",
+                    key,
+                ).fetchone()
+                saved[key] = SourceStats(queries, hits, wins, latencies)
+            conn.commit()
+        finally:
+            conn.close()
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Source stats error: {e}")
+        return
+
+    # the saved totals include the counts of other processes
+    _stats.update(saved)
+    _pending.clear()
+
+
+def flush():
+    """Save any pending statistics to disk, if anything was recorded."""
+    with _lock:
+        _flush()
+
+
+def record_query(
+    species_name: str, source: str, hit: bool, latency: float | None
+):
+    """
+    Record the outcome of one database query.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name that was searched.
+    source : str
+        Source name.
+    hit : bool
+        Whether the source returned a result.
+    latency : Optional[float]
+        Time taken in seconds, or None if it does not reflect the source
+        (e.g. the answer was replayed from a cache).
+    """
+    keys = [(taxon_group(species_name), source), (ALL_TAXA, source)]
+    with _lock:
+        _ensure_loaded()
+        for group, name in keys:
+            for stats in (_get(group, name), _get_pending(group, name)):
+                stats.queries += 1
+                stats.hits += int(hit)
+                if latency is not None:
+                    stats.latencies.append(latency)
+        _updated()
+
+
+def record_win(species_name: str, source: str):
+    """
+    Record that a source's reference was chosen for a search.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name that was searched.
+    source : str
+        Source whose reference was chosen.
+    """
+    keys = [(taxon_group(species_name), source), (ALL_TAXA, source)]
+    with _lock:
+        _ensure_loaded()
+        for group, name in keys:
+            _get(group, name).wins += 1
+            _get_pending(group, name).wins += 1
+        _updated()
+
+
+def get_stats(source: str, species_name: str | None = None) -> SourceStats:
+    """
+    Get the statistics that apply to a source for a name.
+
+    Group statistics are used once they have enough samples; otherwise the
+    statistics across all taxa are returned.
+
+    Parameters
+    ----------
+    source : str
+        Source name.
+    species_name : str
+        Optional scientific name selecting the taxonomic group.
+
+    Returns
+    -------
+    SourceStats
+        Statistics for the source.
+    """
+    with _lock:
+        _ensure_loaded()
+        if species_name is not None:
+            group_stats = _stats.get((taxon_group(species_name), source))
+            if (
+                group_stats is not None
+                and group_stats.queries >= SOURCE_STATS_MIN_SAMPLES
+            ):
+                return group_stats
+        return _get(ALL_TAXA, source)
+
+
+def plan_sources(
+    species_name: str, sources: list[str], always: tuple[str, ...] = ()
+) -> list[str]:
+    """
+    Choose which sources to query for a name.
+
+    Sources with enough samples are skipped if their hit rate is below the
+    configured minimum, or if their references are rarely chosen and
+    their 95th percentile latency is slow, except on a random share of
+    searches used for exploration. The chosen sources are all queried at
+    once, so they keep their default order.
+
+    Parameters
+    ----------
+    species_name : str
+        Scientific name to search for.
+    sources : List[str]
+        Candidate sources, in their default order.
+    always : Tuple[str, ...]
+        Sources that are never skipped.
+
+    Returns
+    -------
+    List[str]
+        Sources to query, in their default order.
+    """
+    if not SOURCE_STATS_ADAPTIVE:
+        return list(sources)
+
+    explore = random.random() < SOURCE_STATS_EXPLORE_RATE
+    planned = []
+    for source in sources:
+        stats = get_stats(source, species_name)
+        p95 = stats.latency_percentile(95)
+        low_yield = stats.queries >= SOURCE_STATS_MIN_SAMPLES and (
+            stats.hit_rate < SOURCE_STATS_MIN_HIT_RATE
+            or (
+                stats.win_rate < SOURCE_STATS_MIN_WIN_RATE
+                and p95 is not None
+                and p95 > SOURCE_STATS_SLOW_LATENCY
+            )
+        )
+        if low_yield and not explore and source not in always:
+            continue
+        planned.append(source)
+
+    return planned
+
+
+# save pending statistics when the interpreter exits
+atexit.register(flush)
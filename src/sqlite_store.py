@@ -0,0 +1,115 @@
+"""
+Per-thread SQLite connections shared by the on-disk caches and indexes.
+
+The response cache, detail cache, DOI index, negative cache and shared
+results tier each keep a small SQLite file. A SQLiteStore holds one
+connection per thread to such a file, creates its tables on the first
+connection, and reconnects when the file path changes. It also counts
+writes so that periodic maintenance, such as eviction or purging of old
+entries, runs once every so many writes.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+# query parameters bound per statement, well under SQLite's limit
+MAX_PARAMETERS = 500
+
+
+class SQLiteStore:
+    """
+    Per-thread connections to one SQLite file and its write counter.
+
+    Parameters
+    ----------
+    schema : List[str]
+        Statements creating the tables and indexes if they do not exist.
+    wal : bool
+        Whether to use write-ahead logging. Files that may live on a
+        network filesystem should not, since WAL needs memory shared
+        between the processes.
+    maintenance_interval : int
+        Writes between maintenance runs (see count_writes), or 0 for none.
+    """
+
+    def __init__(self, schema, wal=True, maintenance_interval=0):
+        self.schema = schema
+        self.wal = wal
+        self.maintenance_interval = maintenance_interval
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+    def connect(self, path: Path) -> sqlite3.Connection:
+        """
+        Get this thread's connection to a file, creating the tables.
+
+        Parameters
+        ----------
+        path : Path
+            SQLite file; a different path than before opens a new
+            connection.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Open connection.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "path", None) != path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, timeout=30)
+            if self.wal:
+                conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self.schema:
+                conn.execute(statement)
+            conn.commit()
+            self._local.conn = conn
+            self._local.path = path
+        return conn
+
+    def count_writes(self, count: int = 1) -> bool:
+        """
+        Count writes and tell whether maintenance is due.
+
+        Parameters
+        ----------
+        count : int
+            Number of rows written.
+
+        Returns
+        -------
+        bool
+            True once every maintenance_interval writes.
+        """
+        if self.maintenance_interval <= 0:
+            return False
+        with self._writes_lock:
+            self._writes += count
+            if self._writes < self.maintenance_interval:
+                return False
+            self._writes = 0
+            return True
+
+
+def chunked(items: list[Any], size: int = MAX_PARAMETERS) -> Iterator[list]:
+    """
+    Split query parameters into chunks that can be bound in one statement.
+
+    Parameters
+    ----------
+    items : List[Any]
+        Parameters, e.g. keys for an IN clause.
+    size : int
+        Most parameters per chunk.
+
+    Yields
+    ------
+    list
+        Consecutive chunks of the items.
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -3,16 +3,45 @@ Streamlit app for finding original taxonomic descriptions.
 Uses simplified cache-first approach with persistent parquet storage.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import polars as pl
 import streamlit as st
 
-from database_queries import search_taxonomy
+from config_loader import CACHE_MAX_REFRESHES, SEARCH_DEADLINE
+from database_queries import (
+    query_pbdb_local_many,
+    query_worms_many,
+    search_taxonomy,
+    stream_taxonomy,
+)
+from name_normalization import canonical_key, canonical_name
+from single_flight import SingleFlight
 from taxonomy_cache import (
     load_cache,
     lookup_in_cache,
+    lookup_many,
+    save_many,
     save_to_cache,
 )
 
+# in-progress searches by canonical name, shared by all sessions
+_searches = SingleFlight()
+
+# in-progress refreshes of stale cache hits by canonical name
+_refreshes = SingleFlight()
+
+# background refreshes of stale cache hits
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="cache-refresh"
+)
+
+# stale hits queued or being refreshed, at most CACHE_MAX_REFRESHES
+_pending_refreshes = 0
+_pending_refreshes_lock = threading.Lock()
+
 
 def configure_page():
     """Configure the Streamlit page settings."""
@@ -42,6 +71,14 @@ def display_result(result: dict):
             "taxonomic description."
         )
 
+    # sources that could not be reached (failed, timed out or breaker open)
+    if result.get("degraded_sources"):
+        st.warning(
+            f"⚠️ **Incomplete Search**: {result['degraded_sources']} "
+            "could not be reached. The result will be re-resolved on the "
+            "next search."
+        )
+
     # create two columns
     col1, col2 = st.columns([2, 1])
 
@@ -92,49 +129,445 @@ def display_result(result: dict):
             st.write("**Paper Link:** NA")
 
 
-def search_species(species_name: str, use_cache: bool = True) -> dict:
+def has_useful_info(result: dict) -> bool:
+    """
+    Check whether a search result is worth caching.
+
+    Parameters
+    ----------
+    result : dict
+        Result dictionary from search.
+
+    Returns
+    -------
+    bool
+        True if the result has an authority, reference, or DOI.
+    """
+    return (
+        result["taxonomic_authority"] != "Not available"
+        or result["reference"] != "Not available"
+        or (result["doi"] != "Not available" and result["doi"] is not None)
+    )
+
+
+def _save_completed(result: dict):
+    """
+    Save the complete result of a search that returned a partial result.
+
+    Parameters
+    ----------
+    result : dict
+        Complete search result.
+    """
+    result["from_cache"] = False
+    if has_useful_info(result):
+        save_to_cache(result)
+
+
+def _search_term(species_name: str) -> str:
+    """
+    Get the name to search and cache for a species name as entered.
+
+    Parameters
+    ----------
+    species_name : str
+        Species name as entered.
+
+    Returns
+    -------
+    str
+        Canonical name (see name_normalization), or the stripped input if
+        it has no canonical form.
+    """
+    return canonical_name(species_name) or species_name.strip()
+
+
+def _flight_key(search_term: str) -> str:
+    """
+    Build the key under which identical concurrent searches are coalesced.
+
+    Single and streamed searches share one key per canonical name, and
+    shared results are always complete, so a search with a deadline and
+    one without can wait on each other. Searches that bypass the cache are
+    not coalesced, since the shared result may have come from it.
+
+    Parameters
+    ----------
+    search_term : str
+        Species name.
+
+    Returns
+    -------
+    str
+        Key for the search single-flight registry.
+    """
+    return canonical_key(search_term)
+
+
+def _prefetch(search_terms: list[str]) -> dict[str, dict]:
+    """
+    Resolve many names against the local PBDB table and WoRMS at once.
+
+    Parameters
+    ----------
+    search_terms : list[str]
+        Canonical species names.
+
+    Returns
+    -------
+    dict[str, dict]
+        Prefetched source results for search_taxonomy, per name.
+    """
+    # one join against the local PBDB table, and batched WoRMS requests
+    pbdb_hits = {
+        row.pop("search_term"): row
+        for row in query_pbdb_local_many(search_terms).to_dicts()
+    }
+    worms_results = query_worms_many(search_terms)
+
+    prefetched = {}
+    for search_term in search_terms:
+        prefetched[search_term] = {"PBDB": pbdb_hits.get(search_term)}
+        if search_term in worms_results:
+            prefetched[search_term]["WoRMS"] = worms_results[search_term]
+    return prefetched
+
+
+def _refresh_stale(search_terms: list[str]):
+    """
+    Refresh stale cache hits in the background.
+
+    The terms are searched without the cache in one background task and
+    saved to the cache in one write. A result that is missing unreachable
+    sources is not saved, so the stale row keeps being served until a
+    refresh succeeds. Refreshes are coalesced among themselves rather than
+    with searches, since they start from within the search that found the
+    stale hit, and at most CACHE_MAX_REFRESHES are pending at once; stale
+    hits beyond that are refreshed on a later hit.
+
+    Parameters
+    ----------
+    search_terms : list[str]
+        Canonical species names.
+    """
+    global _pending_refreshes
+
+    flights = []
+    with _pending_refreshes_lock:
+        room = CACHE_MAX_REFRESHES - _pending_refreshes
+        for search_term in search_terms:
+            if len(flights) >= room:
+                break
+            key = _flight_key(search_term)
+            flight, leader = _refreshes.join(key)
+            if leader:
+                flights.append((search_term, key, flight))
+        _pending_refreshes += len(flights)
+    if not flights:
+        return
+
+    def refresh():
+        global _pending_refreshes
+
+        terms = [search_term for search_term, _, _ in flights]
+        results = {}
+        try:
+            prefetched = _prefetch(terms)
+            for search_term in terms:
+                result = search_taxonomy(
+                    search_term, prefetched=prefetched[search_term]
+                )
+                result["from_cache"] = False
+                results[search_term] = result
+            save_many(
+                [
+                    result
+                    for result in results.values()
+                    if has_useful_info(result)
+                    and not result.get("degraded_sources")
+                ]
+            )
+        except Exception as e:
+            print(f"Cache refresh error for {', '.join(terms)}: {e}")
+        finally:
+            for search_term, key, flight in flights:
+                _refreshes.finish(key, flight, results.get(search_term))
+            with _pending_refreshes_lock:
+                _pending_refreshes -= len(flights)
+
+    _refresh_executor.submit(refresh)
+
+
+def search_species(
+    species_name: str, use_cache: bool = True, deadline: float | None = None
+) -> dict:
     """
     Search for species with cache-first approach.
 
+    Concurrent cached searches for the same name, from any session and
+    whether streamed or not, wait for one search and share its complete
+    result.
+
     Parameters
     ----------
     species_name : str
         Species name to search.
     use_cache : bool
         Whether to use cache.
+    deadline : float | None
+        Optional seconds to wait for the search. A result returned at
+        the deadline has partial=True; the complete result is saved to the
+        cache when ready. Only the search that starts a shared search
+        returns early; searches that join it wait for the complete result.
 
     Returns
     -------
     dict
         Search results.
     """
-    # normalize search term
-    search_term = species_name.strip()
+    search_term = _search_term(species_name)
+    if not use_cache:
+        return _search_species(search_term, False, deadline)
+
+    key = _flight_key(search_term)
+    flight, leader = _searches.join(key)
+    if not leader:
+        result = flight.wait()
+        if result is not None:
+            return result.copy()
+        # the other search failed; run this one independently
+        return _search_species(search_term, True, deadline)
+
+    def completed(result: dict | None):
+        _searches.finish(key, flight, result)
+
+    result = None
+    try:
+        result = _search_species(search_term, True, deadline, completed)
+        return result
+    finally:
+        # a partial result is shared once its search completes
+        if result is None or not result.get("partial"):
+            _searches.finish(key, flight, result)
+
+
+def _search_species(
+    search_term: str,
+    use_cache: bool,
+    deadline: float | None,
+    on_complete=None,
+) -> dict:
+    """
+    Search for a species without coalescing (see search_species).
+
+    Parameters
+    ----------
+    search_term : str
+        Canonical species name.
+    use_cache : bool
+        Whether to use cache.
+    deadline : float | None
+        Optional seconds to wait for the search.
+    on_complete : callable
+        Optional function called with the complete result (None if the
+        search failed) after a partial result was returned.
 
-    # check cache first
+    Returns
+    -------
+    dict
+        Search results.
+    """
+    # check cache first; results missing unreachable sources are redone
     if use_cache:
         cached = lookup_in_cache(search_term)
-        if cached:
+        if cached and not cached.get("degraded_sources"):
             cached["from_cache"] = True
+            if cached["stale"]:
+                _refresh_stale([search_term])
             return cached
 
+    def completed(result: dict | None):
+        if result is not None:
+            _save_completed(result)
+        if on_complete is not None:
+            on_complete(result)
+
     # search databases
-    result = search_taxonomy(search_term)
+    result = search_taxonomy(
+        search_term, deadline=deadline, on_complete=completed
+    )
     result["from_cache"] = False
 
     # only save to cache if we found some useful information
-    has_useful_info = (
-        result["taxonomic_authority"] != "Not available"
-        or result["reference"] != "Not available"
-        or (result["doi"] != "Not available" and result["doi"] is not None)
-    )
-
-    if has_useful_info:
+    if not result.get("partial") and has_useful_info(result):
         save_to_cache(result)
 
     return result
 
 
+def search_species_stream(species_name: str, use_cache: bool = True):
+    """
+    Search for species with cache-first approach, yielding progress events.
+
+    If the same name is already being searched, by another session or by
+    search_species, only the final event is yielded, once that search
+    finishes. Searches that bypass the cache are not coalesced.
+
+    Parameters
+    ----------
+    species_name : str
+        Species name to search.
+    use_cache : bool
+        Whether to use cache.
+
+    Yields
+    ------
+    dict
+        Events from stream_taxonomy; the last one ("final") holds the
+        search results. A cache hit yields only the final event.
+    """
+    search_term = _search_term(species_name)
+    if not use_cache:
+        yield from _search_species_stream(search_term, False)
+        return
+
+    key = _flight_key(search_term)
+    flight, leader = _searches.join(key)
+    if not leader:
+        start = time.perf_counter()
+        result = flight.wait()
+        if result is not None:
+            yield {
+                "event": "final",
+                "source": None,
+                "elapsed": time.perf_counter() - start,
+                "result": result.copy(),
+            }
+            return
+        # the other search was interrupted; run this one independently
+        yield from _search_species_stream(search_term, True)
+        return
+
+    finished = False
+    try:
+        for event in _search_species_stream(search_term, True):
+            if event["event"] == "final":
+                _searches.finish(key, flight, event["result"])
+                finished = True
+            yield event
+    finally:
+        if not finished:
+            _searches.finish(key, flight, None)
+
+
+def _search_species_stream(search_term: str, use_cache: bool):
+    """
+    Stream a species search without coalescing (see search_species_stream).
+
+    Parameters
+    ----------
+    search_term : str
+        Canonical species name.
+    use_cache : bool
+        Whether to use cache.
+
+    Yields
+    ------
+    dict
+        Search events.
+    """
+    # check cache first; results missing unreachable sources are redone
+    if use_cache:
+        cached = lookup_in_cache(search_term)
+        if cached and not cached.get("degraded_sources"):
+            cached["from_cache"] = True
+            if cached["stale"]:
+                _refresh_stale([search_term])
+            yield {
+                "event": "final",
+                "source": None,
+                "elapsed": 0.0,
+                "result": cached,
+            }
+            return
+
+    # search databases
+    for event in stream_taxonomy(search_term):
+        if event["event"] == "final":
+            result = event["result"]
+            result["from_cache"] = False
+
+            # only save to cache if we found some useful information
+            if has_useful_info(result):
+                save_to_cache(result)
+        yield event
+
+
+def search_species_many(species_names: list[str], progress=None) -> list:
+    """
+    Search for many species with one cache read and one cache write.
+
+    Parameters
+    ----------
+    species_names : list[str]
+        Species names to search.
+    progress : callable
+        Optional callback called with (done, total, species_name) before
+        each database search.
+
+    Returns
+    -------
+    list
+        Search results, one per input name, in input order. Each has the
+        input line as input_name and the canonical name as search_term.
+    """
+    # search each canonical name once, whatever form it was entered in
+    input_names = [species.strip() for species in species_names]
+    canonical = {name: _search_term(name) for name in input_names}
+    hits, misses = lookup_many(list(dict.fromkeys(canonical.values())))
+
+    # re-resolve cached results that were missing unreachable sources,
+    # and refresh stale ones together in the background
+    stale = []
+    for search_term, cached in list(hits.items()):
+        if cached.get("degraded_sources"):
+            del hits[search_term]
+            misses.append(search_term)
+        elif cached["stale"]:
+            stale.append(search_term)
+    _refresh_stale(stale)
+
+    prefetched = _prefetch(misses)
+
+    # search databases only for names missing from the cache
+    fresh = {}
+    for i, search_term in enumerate(misses):
+        if progress is not None:
+            progress(i, len(misses), search_term)
+        result = search_taxonomy(
+            search_term, prefetched=prefetched[search_term]
+        )
+        result["from_cache"] = False
+        fresh[search_term] = result
+
+    # only save to cache if we found some useful information
+    save_many([result for result in fresh.values() if has_useful_info(result)])
+
+    # fan the results back out to the input lines
+    results = []
+    for input_name in input_names:
+        search_term = canonical[input_name]
+        if search_term in hits:
+            result = hits[search_term].copy()
+            result["from_cache"] = True
+        else:
+            result = fresh[search_term].copy()
+        result["input_name"] = input_name
+        results.append(result)
+
+    return results
+
+
 def show_single_search():
     """Show single species search interface."""
     st.subheader("🔍 Single Species Search")
@@ -147,15 +580,58 @@ def show_single_search():
 
     if st.button("Search", type="primary", key="search_single"):
         if species_name:
-            with st.spinner(f"Searching for {species_name}..."):
-                result = search_species(species_name, use_cache=True)
-
             st.divider()
-            display_result(result)
+            show_streamed_search(species_name)
         else:
             st.warning("Please enter a species name")
 
 
+def show_streamed_search(species_name: str):
+    """
+    Show a single search as it runs, one line per database.
+
+    A provisional result from the databases that have answered is shown
+    once the search has taken longer than the search deadline, and is
+    replaced by the complete result at the end.
+
+    Parameters
+    ----------
+    species_name : str
+        Species name to search.
+    """
+    status = st.status(f"Searching for {species_name}...")
+    placeholder = st.empty()
+    result = None
+    for event in search_species_stream(species_name):
+        kind = event["event"]
+        elapsed = f"{event['elapsed']:.2f}s"
+        if kind == "final":
+            result = event["result"]
+        elif kind == "started":
+            status.write(f"⏳ {event['source']}: searching")
+        elif kind == "miss":
+            status.write(f"➖ {event['source']}: no match ({elapsed})")
+        elif kind == "error":
+            status.write(f"❌ {event['source']}: unavailable ({elapsed})")
+        elif kind == "result":
+            status.write(f"✅ {event['source']}: found ({elapsed})")
+            if event["elapsed"] >= SEARCH_DEADLINE:
+                with placeholder.container():
+                    display_result(event["provisional"])
+                    st.info("⏳ Some sources are still being searched...")
+
+    if result is None:
+        # the stream ended without a final event
+        status.update(label=f"Search for {species_name} failed", state="error")
+        return
+
+    status.update(
+        label=f"Search for {species_name} complete", state="complete"
+    )
+    with placeholder.container():
+        display_result(result)
+
+
 def show_batch_search():
     """Show batch search interface."""
     st.subheader("📋 Batch Search")
@@ -223,12 +699,11 @@ def show_batch_search():
         progress = st.progress(0)
         status = st.empty()
 
-        results = []
-        for i, species in enumerate(species_list):
+        def report_progress(done: int, total: int, species: str):
             status.text(f"Searching for {species}...")
-            result = search_species(species, use_cache=True)
-            results.append(result)
-            progress.progress((i + 1) / len(species_list))
+            progress.progress(done / total)
+
+        results = search_species_many(species_list, progress=report_progress)
 
         progress.empty()
         status.empty()
@@ -236,7 +711,7 @@ def show_batch_search():
         # display results
         st.subheader("Results")
         for result in results:
-            with st.expander(f"{result['search_term']} - {result['source']}"):
+            with st.expander(f"{result['input_name']} - {result['source']}"):
                 display_result(result)
 
         # option to download results
@@ -448,7 +923,7 @@ def main():
     taxonomic authorities and publication references for fossil and modern
     species. When you search for a species, the system first checks the
     local cache for previously retrieved results, then queries each database
-    sequentially if no cached data exists. The application uses reference
+    concurrently if no cached data exists. The application uses reference
     validation to ensure that publication years match the taxonomic authority
     years, providing warnings when mismatches occur that might indicate the
     reference is not the original taxonomic description. All successful
@@ -467,8 +942,8 @@ def main():
         "<https://github.com/O957/fossil-species-references/blob/main/LICENSE>"
     )
     st.markdown(
-        "**NOTE** A small delay is added between queries to be respectful "
-        "to the PBDB API."
+        "**NOTE** Requests to each external database are rate limited to be "
+        "respectful to their APIs."
     )
     st.markdown(
         "__How may I contribute to this project?__\n"
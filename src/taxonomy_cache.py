@@ -1,51 +1,815 @@
 """
 Persistent cache functions for taxonomy search results using parquet format.
+
+New results are written to small append-only segment files so that the cost
+of a write does not grow with the size of the cache. Reads merge the
+compacted base file with any pending segments, and a compaction step folds
+the segments back into a single base file sorted by search term, keeping
+only the most recent row per term.
+
+Every file is written to a temporary name, fsynced and renamed into place,
+so a crash never leaves a partial file behind. Writers in this process are
+batched into group commits, and an advisory file lock keeps compaction in
+one process from racing writers or compactions in another.
+
+Rows are aged by the source of their authority. Past its max age a row is
+stale: it is still served, flagged so the caller can refresh it in the
+background, until the stale-while-revalidate window ends and it expires.
+Rows without a timestamp, such as the seed rows shipped with the app, are
+always stale. Hits are counted in memory, written to small append-only
+usage files along with new results, every few hits and at exit, and
+folded into the hit_count and last_access columns at compaction, so usage
+survives restarts. Compaction also drops expired rows and evicts the
+least recently (or least frequently) used rows beyond the row and byte
+caps.
+
+Lookups read through a bounded in-memory tier in front of the parquet
+store and, if configured, a tier shared by all replicas behind it (see
+cache_tiers). New results are written through to every tier, and shared
+hits are promoted into the local ones.
+
+A separate negative cache records, per source, names that the source had
+no match for or failed on, so repeated bad names skip that source until
+the entry's TTL runs out.
 """
 
+import atexit
+import contextlib
+import os
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import polars as pl
 
-from config_loader import NOT_AVAILABLE
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+from cache_tiers import LRUCache, make_shared_backend
+from config_loader import (
+    CACHE_EVICTION,
+    CACHE_MAX_AGES,
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ROWS,
+    CACHE_MEMORY_ENTRIES,
+    CACHE_MEMORY_TTL,
+    CACHE_STALE_WHILE_REVALIDATE,
+    COMPACTION_MAX_SEGMENTS,
+    COMPACTION_MIN_SEGMENTS,
+    COMPACTION_SIZE_RATIO,
+    NEGATIVE_CACHE_ERROR_TTL,
+    NEGATIVE_CACHE_FILE_NAME,
+    NEGATIVE_CACHE_NO_MATCH_TTL,
+    NOT_AVAILABLE,
+    SEGMENT_DIR_NAME,
+    SHARED_CACHE_BACKEND,
+    SHARED_CACHE_LOCATION,
+)
+from name_normalization import canonical_key
+from sqlite_store import SQLiteStore
 
 # cache file location
 CACHE_FILE = Path(__file__).parent.parent / "data" / "results.parquet"
 
+# directory for append-only write segments awaiting compaction
+SEGMENT_DIR = CACHE_FILE.parent / SEGMENT_DIR_NAME
+
+# directory for hit counts awaiting compaction, one file per flush
+USAGE_DIR = SEGMENT_DIR / "usage"
+
+# advisory lock shared by all processes using this cache
+LOCK_FILE = CACHE_FILE.parent / ".results.lock"
+
+# per-source misses and errors, kept next to the results
+NEGATIVE_CACHE_FILE = CACHE_FILE.parent / NEGATIVE_CACHE_FILE_NAME
+
+# negative cache outcomes and how long each is trusted
+NO_MATCH = "no_match"
+SOURCE_ERROR = "error"
+NEGATIVE_TTLS = {
+    NO_MATCH: NEGATIVE_CACHE_NO_MATCH_TTL,
+    SOURCE_ERROR: NEGATIVE_CACHE_ERROR_TTL,
+}
+
+# schema shared by the base file and all segments
+CACHE_SCHEMA = {
+    "search_term": pl.Utf8,
+    "taxonomic_authority": pl.Utf8,
+    "year": pl.Int64,
+    "author": pl.Utf8,
+    "reference": pl.Utf8,
+    "doi": pl.Utf8,
+    "paper_link": pl.Utf8,
+    "source": pl.Utf8,
+    "year_mismatch": pl.Boolean,
+    "degraded_sources": pl.Utf8,
+    "timestamp": pl.Datetime,
+    "hit_count": pl.Int64,
+    "last_access": pl.Datetime,
+}
+
+# freshness of a cached row (see cache_freshness)
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+# process-resident index of the most recent row per normalized search term;
+# it is rebuilt when the base file changes and patched as segments appear
+_cache_index: dict[str, dict[str, Any]] = {}
+_cache_index_loaded = False
+_cache_index_mtime: int | None = None
+_cache_index_segments: set[str] = set()
+_cache_index_lock = threading.Lock()
+
+# only one compaction runs at a time within this process
+_compaction_lock = threading.Lock()
+_compaction_thread: threading.Thread | None = None
+_compaction_thread_lock = threading.Lock()
+
+# hits not yet written to a usage file: key -> (hit count, last access)
+_access_stats: dict[str, tuple[int, datetime]] = {}
+_access_hits = 0
+_access_lock = threading.Lock()
+
+# hits counted in memory before they are written to a usage file
+_USAGE_FLUSH_INTERVAL = 100
+
+# nearest tier: recently used rows by normalized search term
+_memory_cache = LRUCache(CACHE_MEMORY_ENTRIES, CACHE_MEMORY_TTL)
+
+# farthest tier, shared by all replicas (None if not configured)
+_shared_cache = make_shared_backend(
+    SHARED_CACHE_BACKEND, SHARED_CACHE_LOCATION
+)
+
+# usage columns that stay local to each replica
+_USAGE_COLUMNS = ("hit_count", "last_access")
+
+
+@contextlib.contextmanager
+def _file_lock(exclusive: bool):
+    """
+    Hold the cross-process cache lock for the duration of a block.
+
+    Segment writers take the lock shared, so they never block each other;
+    compaction and clearing take it exclusively.
+
+    Parameters
+    ----------
+    exclusive : bool
+        Whether to take the lock exclusively.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, "a") as lock_file:
+        fcntl.flock(
+            lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        )
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _fsync_dir(path: Path):
+    """
+    Flush a directory entry to disk so a rename survives a crash.
+
+    Parameters
+    ----------
+    path : Path
+        Directory to flush.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _atomic_write_parquet(df: pl.DataFrame, path: Path):
+    """
+    Write a parquet file atomically via a temporary file and rename.
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        Data to write.
+    path : Path
+        Final location of the file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            df.write_parquet(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+    _fsync_dir(path.parent)
+
+
+class _GroupCommitter:
+    """
+    Batch rows from concurrent callers into a single segment write.
+
+    The first caller to arrive while no commit is running becomes the
+    leader and writes every row queued so far; callers arriving during
+    that write queue up for the next commit. Each caller returns once the
+    commit containing its rows is durable.
+    """
+
+    class _Batch:
+        def __init__(self):
+            self.rows: list[dict[str, Any]] = []
+            self.name: str | None = None
+            self.error: BaseException | None = None
+            self.done = False
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._current = self._Batch()
+        self._committing = False
+
+    def commit(self, rows: list[dict[str, Any]]) -> str:
+        """
+        Queue rows and wait until they have been written.
+
+        Parameters
+        ----------
+        rows : List[Dict[str, Any]]
+            Prepared cache rows.
+
+        Returns
+        -------
+        str
+            Name of the segment that holds the rows.
+        """
+        with self._cond:
+            batch = self._current
+            batch.rows.extend(rows)
+            while not batch.done:
+                if self._committing:
+                    self._cond.wait()
+                    continue
+
+                # become the leader for this batch
+                self._committing = True
+                self._current = self._Batch()
+                self._cond.release()
+                try:
+                    batch.name = _write_segment(batch.rows)
+                except BaseException as e:
+                    batch.error = e
+                finally:
+                    self._cond.acquire()
+                    batch.done = True
+                    self._committing = False
+                    self._cond.notify_all()
+
+        if batch.error is not None:
+            raise batch.error
+        # a batch without an error always has a segment name
+        assert batch.name is not None
+        return batch.name
+
+
+_group_committer = _GroupCommitter()
+
+
+def _cache_key(search_term: str) -> str:
+    """
+    Normalize a search term into the key used by the cache index.
+
+    Parameters
+    ----------
+    search_term : str
+        The taxonomic name as entered or stored.
+
+    Returns
+    -------
+    str
+        Lowercase canonical name (see name_normalization).
+    """
+    return canonical_key(search_term)
+
+
+def _with_cache_key(cache_df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Add a "_key" column holding the cache key of each search term.
+
+    Parameters
+    ----------
+    cache_df : pl.DataFrame
+        Cache rows with a search_term column.
+
+    Returns
+    -------
+    pl.DataFrame
+        The rows with the "_key" column added.
+    """
+    terms = cache_df.get_column("search_term").unique().drop_nulls()
+    keys = {term: _cache_key(term) for term in terms}
+    return cache_df.with_columns(
+        pl.col("search_term")
+        .replace_strict(keys, default=None, return_dtype=pl.Utf8)
+        .alias("_key")
+    )
+
+
+def _cache_file_mtime() -> int | None:
+    """
+    Get the modification time of the cache file.
+
+    Returns
+    -------
+    Optional[int]
+        Modification time in nanoseconds, or None if the file is missing.
+    """
+    try:
+        return CACHE_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _file_size(path: Path) -> int:
+    """
+    Get the size of a cache file.
+
+    Parameters
+    ----------
+    path : Path
+        Base file or segment file.
+
+    Returns
+    -------
+    int
+        Size in bytes, or 0 if the file is missing.
+    """
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _segment_name() -> str:
+    """
+    Make a unique name for a new segment or usage file.
+
+    Returns
+    -------
+    str
+        File name that sorts after every file written before it.
+    """
+    return (
+        f"{time.time_ns():020d}-{os.getpid()}-{threading.get_ident()}.parquet"
+    )
+
+
+def _list_segments(directory: Path | None = None) -> list[str]:
+    """
+    List pending segment files in write order.
+
+    Parameters
+    ----------
+    directory : Path
+        USAGE_DIR for usage files; result segments in SEGMENT_DIR by
+        default.
+
+    Returns
+    -------
+    List[str]
+        Segment file names, oldest first.
+    """
+    try:
+        names = [
+            entry.name
+            for entry in os.scandir(directory or SEGMENT_DIR)
+            if entry.name.endswith(".parquet")
+        ]
+    except OSError:
+        return []
+
+    # names start with a zero-padded nanosecond timestamp
+    return sorted(names)
+
+
+def _empty_cache() -> pl.DataFrame:
+    """
+    Create an empty cache DataFrame.
+
+    Returns
+    -------
+    pl.DataFrame
+        Empty dataframe with the cache schema.
+    """
+    return pl.DataFrame(schema=CACHE_SCHEMA)
+
+
+def _read_frame(path: Path) -> pl.DataFrame | None:
+    """
+    Read one parquet file of the cache, tolerating missing or bad files.
+
+    Parameters
+    ----------
+    path : Path
+        Base file or segment file to read.
+
+    Returns
+    -------
+    Optional[pl.DataFrame]
+        File contents, or None if it could not be read.
+    """
+    try:
+        return pl.read_parquet(str(path))
+    except (OSError, pl.exceptions.ComputeError):
+        return None
+
+
+def _merge_frames(frames: list[pl.DataFrame]) -> pl.DataFrame:
+    """
+    Concatenate cache frames, filling columns missing from older files.
+
+    Parameters
+    ----------
+    frames : List[pl.DataFrame]
+        Frames read from the base file and segments.
+
+    Returns
+    -------
+    pl.DataFrame
+        Combined dataframe with the cache schema.
+    """
+    frames = [frame for frame in frames if not frame.is_empty()]
+    if not frames:
+        return _empty_cache()
+
+    merged = pl.concat([_empty_cache(), *frames], how="diagonal_relaxed")
+    return merged.select(list(CACHE_SCHEMA))
+
+
+def _index_rows(index: dict[str, dict[str, Any]], cache_df: pl.DataFrame):
+    """
+    Add the rows of a cache frame to an index, keeping the newest per term.
+
+    Parameters
+    ----------
+    index : Dict[str, Dict[str, Any]]
+        Index to update in place.
+    cache_df : pl.DataFrame
+        Rows to add.
+    """
+    # rows are visited oldest first so the newest row wins
+    for row in cache_df.sort("timestamp").to_dicts():
+        if not row["search_term"]:
+            continue
+        key = _cache_key(row["search_term"])
+        existing = index.get(key)
+        if (
+            existing is None
+            or existing["timestamp"] is None
+            or (
+                row["timestamp"] is not None
+                and row["timestamp"] >= existing["timestamp"]
+            )
+        ):
+            index[key] = row
+
+
+def _get_cache_index() -> dict[str, dict[str, Any]]:
+    """
+    Get the in-memory cache index, refreshing it if the files changed.
+
+    The index is rebuilt from scratch when the base file changes (e.g. after
+    a compaction). New segments written by other sessions or processes are
+    read individually and merged into the existing index.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        Mapping of normalized search term to its most recent cached row.
+    """
+    global _cache_index, _cache_index_loaded
+    global _cache_index_mtime, _cache_index_segments, _access_hits
+
+    mtime = _cache_file_mtime()
+    segments = _list_segments()
+    with _cache_index_lock:
+        if not _cache_index_loaded or mtime != _cache_index_mtime:
+            index = {}
+            _index_rows(index, load_cache())
+            _cache_index = index
+            _cache_index_loaded = True
+            _cache_index_mtime = mtime
+            _cache_index_segments = set(segments)
+            return _cache_index
+
+        # segments that vanished were folded into the base file we indexed
+        _cache_index_segments.intersection_update(segments)
+        for name in segments:
+            if name in _cache_index_segments:
+                continue
+            frame = _read_frame(SEGMENT_DIR / name)
+            if frame is not None:
+                _index_rows(_cache_index, _merge_frames([frame]))
+            _cache_index_segments.add(name)
+
+        return _cache_index
+
 
 def load_cache() -> pl.DataFrame:
     """
     Load existing cache or create empty DataFrame.
 
+    The compacted base file and all pending segments are merged, so the
+    result may contain more than one row per search term until the next
+    compaction.
+
     Returns
     -------
     pl.DataFrame
         Cache dataframe with taxonomy results.
     """
+    frames = []
     if CACHE_FILE.exists():
-        try:
-            return pl.read_parquet(str(CACHE_FILE))
-        except (OSError, pl.exceptions.ComputeError):
-            pass
+        base_df = _read_frame(CACHE_FILE)
+        if base_df is not None:
+            frames.append(base_df)
+        else:
+            print(f"Cache error: could not read {CACHE_FILE}")
 
-    # create empty dataframe with schema
-    return pl.DataFrame(
-        schema={
-            "search_term": pl.Utf8,
-            "taxonomic_authority": pl.Utf8,
-            "year": pl.Int64,
-            "author": pl.Utf8,
-            "reference": pl.Utf8,
-            "doi": pl.Utf8,
-            "paper_link": pl.Utf8,
-            "source": pl.Utf8,
-            "year_mismatch": pl.Boolean,
-            "timestamp": pl.Datetime,
-        }
+    for name in _list_segments():
+        segment_df = _read_frame(SEGMENT_DIR / name)
+        if segment_df is not None:
+            frames.append(segment_df)
+
+    return _merge_frames(frames)
+
+
+def _max_age(source: str | None) -> float:
+    """
+    Get the max age of a cached row from its source.
+
+    Parameters
+    ----------
+    source : Optional[str]
+        Source column, e.g. "GBIF" or "GBIF (ref: PBDB)".
+
+    Returns
+    -------
+    float
+        Seconds the row stays fresh.
+    """
+    primary = (source or "").split(" (")[0]
+    return CACHE_MAX_AGES.get(primary, CACHE_MAX_AGES["default"])
+
+
+def cache_freshness(row: dict[str, Any]) -> str:
+    """
+    Classify a cached row by its age.
+
+    Parameters
+    ----------
+    row : Dict[str, Any]
+        Cached row with timestamp and source.
+
+    Returns
+    -------
+    str
+        FRESH within the max age of its source, STALE within the
+        stale-while-revalidate window after it, EXPIRED beyond. Rows
+        without a timestamp are STALE.
+    """
+    if row.get("timestamp") is None:
+        return STALE
+    age = (datetime.now() - row["timestamp"]).total_seconds()
+    max_age = _max_age(row.get("source"))
+    if age < max_age:
+        return FRESH
+    if age < max_age + CACHE_STALE_WHILE_REVALIDATE:
+        return STALE
+    return EXPIRED
+
+
+def _record_access(keys: list[str]):
+    """
+    Count cache hits, writing them to a usage file every few hits.
+
+    Parameters
+    ----------
+    keys : List[str]
+        Cache keys that were hit.
+    """
+    global _access_hits
+
+    now = datetime.now()
+    with _access_lock:
+        for key in keys:
+            hits, _ = _access_stats.get(key, (0, now))
+            _access_stats[key] = (hits + 1, now)
+        _access_hits += len(keys)
+        due = _access_hits >= _USAGE_FLUSH_INTERVAL
+
+    if due:
+        flush_usage()
+        maybe_compact_cache()
+
+
+def _merge_access(access: dict[str, tuple[int, datetime]]):
+    """
+    Add hit counts back to the in-memory counts. Call with _access_lock held.
+
+    Parameters
+    ----------
+    access : Dict[str, Tuple[int, datetime]]
+        Hit count and last access per cache key.
+    """
+    for key, (hits, when) in access.items():
+        pending_hits, pending_when = _access_stats.get(key, (0, when))
+        _access_stats[key] = (pending_hits + hits, max(pending_when, when))
+
+
+def flush_usage():
+    """Write the hits counted in memory to a new usage file."""
+    global _access_hits
+
+    with _access_lock:
+        access = dict(_access_stats)
+        _access_stats.clear()
+        _access_hits = 0
+    if not access:
+        return
+
+    try:
+        with _file_lock(exclusive=False):
+            _atomic_write_parquet(
+                _usage_frame(access), USAGE_DIR / _segment_name()
+            )
+    except OSError as e:
+        print(f"Cache error: {e}")
+        # keep the hits for the next flush
+        with _access_lock:
+            _merge_access(access)
+
+
+def _serve(row: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Turn an indexed or joined row into a cache hit.
+
+    Parameters
+    ----------
+    row : Dict[str, Any]
+        Most recent cached row for a term.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        Copy of the row with stale=True if it should be refreshed, or None
+        if it has expired.
+    """
+    freshness = cache_freshness(row)
+    if freshness == EXPIRED:
+        return None
+    _record_access([_cache_key(row["search_term"])])
+    # copy so callers can annotate the result without touching the index
+    result = row.copy()
+    result["stale"] = freshness == STALE
+    return result
+
+
+def _to_shared(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a cache row into an entry for the shared tier.
+
+    Parameters
+    ----------
+    row : Dict[str, Any]
+        Cache row.
+
+    Returns
+    -------
+    Dict[str, Any]
+        JSON-compatible entry without the local usage columns.
+    """
+    entry = {}
+    for column in CACHE_SCHEMA:
+        if column in _USAGE_COLUMNS:
+            continue
+        value = row.get(column)
+        entry[column] = (
+            value.isoformat() if isinstance(value, datetime) else value
+        )
+    return entry
+
+
+def _from_shared(entry: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert an entry of the shared tier back into a cache row.
+
+    Parameters
+    ----------
+    entry : Dict[str, Any]
+        Entry made by _to_shared.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Cache row with a fresh local usage history.
+    """
+    row = {}
+    for column, dtype in CACHE_SCHEMA.items():
+        value = entry.get(column)
+        if dtype == pl.Datetime and value is not None:
+            value = datetime.fromisoformat(value)
+        row[column] = value
+    row["hit_count"] = 0
+    row["last_access"] = datetime.now()
+    return row
+
+
+def _is_newer(row: dict[str, Any], other: dict[str, Any] | None) -> bool:
+    """
+    Check whether a row is more recent than another.
+
+    Parameters
+    ----------
+    row : Dict[str, Any]
+        Candidate row.
+    other : Optional[Dict[str, Any]]
+        Row it would replace, if any.
+
+    Returns
+    -------
+    bool
+        True if the row should replace the other.
+    """
+    if other is None or other["timestamp"] is None:
+        return True
+    return (
+        row["timestamp"] is not None and row["timestamp"] > other["timestamp"]
     )
 
 
+def _read_through(
+    rows: dict[str, dict[str, Any] | None],
+) -> dict[str, dict[str, Any]]:
+    """
+    Complete parquet lookups from the shared tier and fill the local tiers.
+
+    Keys missing from the parquet store, or whose row is no longer fresh,
+    are looked up in the shared tier, where another replica may have a
+    newer row. Newer shared rows are promoted into the parquet store, and
+    every row found is kept in the memory tier.
+
+    Parameters
+    ----------
+    rows : Dict[str, Optional[Dict[str, Any]]]
+        Parquet row, or None, per normalized search term.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        Most recent row per normalized search term that was found.
+    """
+    found = {key: row for key, row in rows.items() if row is not None}
+
+    if _shared_cache is not None:
+        wanted = [
+            key
+            for key, row in rows.items()
+            if row is None or cache_freshness(row) != FRESH
+        ]
+        promoted = []
+        for key, entry in _shared_cache.get_many(wanted).items():
+            shared_row = _from_shared(entry)
+            if _is_newer(shared_row, found.get(key)):
+                found[key] = shared_row
+                promoted.append(shared_row)
+        if promoted:
+            _append_rows(promoted)
+
+    for key, row in found.items():
+        _memory_cache.put(key, row)
+    return found
+
+
 def lookup_in_cache(search_term: str) -> dict[str, Any] | None:
     """
     Look up a search term in the cache.
@@ -58,44 +822,107 @@ def lookup_in_cache(search_term: str) -> dict[str, Any] | None:
     Returns
     -------
     Optional[Dict[str, Any]]
-        Cached result if found, None otherwise.
+        Cached result if found and not expired, None otherwise. Its stale
+        key is True if it is past its max age and should be refreshed.
     """
-    cache_df = load_cache()
-
-    if cache_df.is_empty():
+    # canonical-name search against the most recent row per term
+    key = _cache_key(search_term)
+    row = _memory_cache.get(key)
+    if row is None:
+        row = _read_through({key: _get_cache_index().get(key)}).get(key)
+    if row is None:
         return None
+    return _serve(row)
 
-    # case-insensitive search
-    result = cache_df.filter(
-        pl.col("search_term").str.to_lowercase() == search_term.lower()
-    )
 
-    if not result.is_empty():
-        # return most recent result
-        result = result.sort("timestamp", descending=True).limit(1)
-        return result.to_dicts()[0]
+def lookup_many(
+    search_terms: list[str],
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    """
+    Look up many search terms in the cache with a single read and join.
 
-    return None
+    Parameters
+    ----------
+    search_terms : List[str]
+        The taxonomic names to search for.
 
+    Returns
+    -------
+    Tuple[Dict[str, Dict[str, Any]], List[str]]
+        Cached results keyed by the stripped input name, and the stripped
+        input names that were not found or have expired, in input order
+        and with one name per cache key, so names that differ only in
+        form are searched once. Results have the stale key of
+        lookup_in_cache.
+    """
+    terms = list(dict.fromkeys(term.strip() for term in search_terms))
+    if not terms:
+        return {}, []
 
-def save_to_cache(result: dict[str, Any]):
+    keys = {term: _cache_key(term) for term in terms}
+    rows = {}
+    for key in set(keys.values()):
+        row = _memory_cache.get(key)
+        if row is not None:
+            rows[key] = row
+
+    pending = list(dict.fromkeys(k for k in keys.values() if k not in rows))
+    if pending:
+        local = {}
+        cache_df = load_cache()
+        if not cache_df.is_empty():
+            # most recent row per normalized search term
+            latest = (
+                _with_cache_key(
+                    cache_df.filter(pl.col("search_term").is_not_null())
+                )
+                .sort("timestamp", nulls_last=False)
+                .unique(subset="_key", keep="last")
+            )
+            inputs = pl.DataFrame({"_key": pending}, schema={"_key": pl.Utf8})
+            for row in inputs.join(latest, on="_key").to_dicts():
+                local[row.pop("_key")] = row
+        rows.update(_read_through({key: local.get(key) for key in pending}))
+
+    hits = {}
+    misses = []
+    missed_keys = set()
+    for term in terms:
+        key = keys[term]
+        row = rows.get(key)
+        hit = None if row is None else _serve(row)
+        if hit is not None:
+            hits[term] = hit
+        elif key not in missed_keys:
+            missed_keys.add(key)
+            misses.append(term)
+
+    return hits, misses
+
+
+def _prepare_row(result: dict[str, Any]) -> dict[str, Any]:
     """
-    Save a new result to the cache.
+    Convert a search result into a row matching the cache schema.
 
     Parameters
     ----------
     result : Dict[str, Any]
         Result dictionary to save.
-    """
-    # load current cache
-    cache_df = load_cache()
 
+    Returns
+    -------
+    Dict[str, Any]
+        Row with every cache column filled and a fresh timestamp.
+    """
     # prepare result for saving
     result = result.copy()
     result.pop("from_cache", None)  # remove from_cache field if present
+    result.pop("stale", None)
 
-    # add timestamp
+    # add timestamp; a new row starts its own usage history
     result["timestamp"] = datetime.now()
+    result["hit_count"] = 0
+    result["last_access"] = result["timestamp"]
 
     # ensure all required fields exist
     for field in [
@@ -108,12 +935,15 @@ def save_to_cache(result: dict[str, Any]):
         "paper_link",
         "source",
         "year_mismatch",
+        "degraded_sources",
     ]:
         if field not in result:
             if field == "year":
                 result[field] = None
             elif field == "year_mismatch":
                 result[field] = False
+            elif field == "degraded_sources":
+                result[field] = ""
             else:
                 result[field] = NOT_AVAILABLE
 
@@ -126,30 +956,314 @@ def save_to_cache(result: dict[str, Any]):
     else:
         result["year"] = None
 
-    # append to dataframe
-    new_row = pl.DataFrame([result])
-    cache_df = pl.concat([cache_df, new_row], how="vertical")
+    return {column: result[column] for column in CACHE_SCHEMA}
 
-    # save to disk
-    cache_df.write_parquet(str(CACHE_FILE))
 
+def _write_segment(rows: list[dict[str, Any]]) -> str:
+    """
+    Write rows to a new append-only segment file.
 
-def clear_cache():
-    """Clear the entire cache by creating an empty file."""
-    empty_df = pl.DataFrame(
+    Parameters
+    ----------
+    rows : List[Dict[str, Any]]
+        Prepared cache rows.
+
+    Returns
+    -------
+    str
+        Name of the segment file that was written.
+    """
+    name = _segment_name()
+
+    # readers only ever see complete segments
+    with _file_lock(exclusive=False):
+        _atomic_write_parquet(
+            pl.DataFrame(rows, schema=CACHE_SCHEMA), SEGMENT_DIR / name
+        )
+    return name
+
+
+def save_to_cache(result: dict[str, Any]):
+    """
+    Save a new result to the cache.
+
+    The result is appended as a new segment, shared with any other results
+    saved concurrently; the base file is not rewritten.
+
+    Parameters
+    ----------
+    result : Dict[str, Any]
+        Result dictionary to save.
+    """
+    save_many([result])
+
+
+def save_many(results: list[dict[str, Any]]):
+    """
+    Save many results to the cache in a single write.
+
+    Parameters
+    ----------
+    results : List[Dict[str, Any]]
+        Result dictionaries to save.
+    """
+    if not results:
+        return
+
+    rows = [_prepare_row(result) for result in results]
+    _append_rows(rows)
+
+    if _shared_cache is not None:
+        _shared_cache.put_many(
+            {_cache_key(row["search_term"]): _to_shared(row) for row in rows}
+        )
+
+
+def _append_rows(rows: list[dict[str, Any]]):
+    """
+    Append prepared rows to the parquet store and the memory tier.
+
+    Parameters
+    ----------
+    rows : List[Dict[str, Any]]
+        Prepared cache rows.
+    """
+    name = _group_committer.commit(rows)
+
+    # keep the in-memory index current without re-reading any file
+    with _cache_index_lock:
+        if _cache_index_loaded:
+            _index_rows(_cache_index, pl.DataFrame(rows, schema=CACHE_SCHEMA))
+            _cache_index_segments.add(name)
+
+    for row in rows:
+        _memory_cache.put(_cache_key(row["search_term"]), row)
+
+    flush_usage()
+    maybe_compact_cache()
+
+
+def _usage_frame(access: dict[str, tuple[int, datetime]]) -> pl.DataFrame:
+    """
+    Convert in-memory hit counts into a frame keyed like the cache.
+
+    Parameters
+    ----------
+    access : Dict[str, Tuple[int, datetime]]
+        Hit count and last access per cache key.
+
+    Returns
+    -------
+    pl.DataFrame
+        Frame with _key, hit_count and last_access columns.
+    """
+    return pl.DataFrame(
+        {
+            "_key": list(access),
+            "hit_count": [hits for hits, _ in access.values()],
+            "last_access": [when for _, when in access.values()],
+        },
         schema={
-            "search_term": pl.Utf8,
-            "taxonomic_authority": pl.Utf8,
-            "year": pl.Int64,
-            "author": pl.Utf8,
-            "reference": pl.Utf8,
-            "doi": pl.Utf8,
-            "paper_link": pl.Utf8,
-            "source": pl.Utf8,
-            "timestamp": pl.Datetime,
-        }
+            "_key": pl.Utf8,
+            "hit_count": pl.Int64,
+            "last_access": pl.Datetime,
+        },
+    )
+
+
+def _expired_expr() -> pl.Expr:
+    """
+    Build an expression that is true for rows past their expiry.
+
+    Returns
+    -------
+    pl.Expr
+        Boolean expression over the source and timestamp columns.
+    """
+    primary = pl.col("source").str.split(" (").list.first()
+    max_age = primary.replace_strict(
+        CACHE_MAX_AGES,
+        default=CACHE_MAX_AGES["default"],
+        return_dtype=pl.Float64,
+    )
+    age = (pl.lit(datetime.now()) - pl.col("timestamp")).dt.total_seconds()
+    return pl.col("timestamp").is_not_null() & (
+        age >= max_age + CACHE_STALE_WHILE_REVALIDATE
     )
-    empty_df.write_parquet(str(CACHE_FILE))
+
+
+def _evict(cache_df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Drop the least recently or least frequently used rows beyond the caps.
+
+    Parameters
+    ----------
+    cache_df : pl.DataFrame
+        Deduplicated cache rows with usage columns.
+
+    Returns
+    -------
+    pl.DataFrame
+        Rows within the row and estimated byte caps.
+    """
+    limit = CACHE_MAX_ROWS
+    size = cache_df.estimated_size()
+    if size > CACHE_MAX_BYTES:
+        limit = min(limit, int(len(cache_df) * CACHE_MAX_BYTES / size))
+    if len(cache_df) <= limit:
+        return cache_df
+
+    if CACHE_EVICTION == "lfu":
+        order = ["hit_count", "last_access"]
+    else:
+        order = ["last_access"]
+    return cache_df.sort(order, nulls_last=False).tail(limit)
+
+
+def compact_cache() -> int:
+    """
+    Fold all pending segments and usage files into the base cache file.
+
+    Only the most recent row per search term is kept, with the hit counts
+    of all its rows and usage files summed. Expired rows are dropped, the
+    row and byte caps are enforced, and the output is sorted by search
+    term.
+
+    Returns
+    -------
+    int
+        Number of segments that were compacted.
+    """
+    with _compaction_lock, _file_lock(exclusive=True):
+        segments = _list_segments()
+        usage_files = _list_segments(USAGE_DIR)
+        with _access_lock:
+            pending_hits = bool(_access_stats)
+        if not segments and not usage_files and not pending_hits:
+            return 0
+
+        frames = []
+        if CACHE_FILE.exists():
+            base_df = _read_frame(CACHE_FILE)
+            if base_df is None:
+                # never replace a base file we could not read
+                print(f"Cache error: could not read {CACHE_FILE}")
+                return 0
+            frames.append(base_df)
+        for name in segments:
+            segment_df = _read_frame(SEGMENT_DIR / name)
+            if segment_df is not None:
+                frames.append(segment_df)
+
+        with _access_lock:
+            usage_frames = [_usage_frame(_access_stats)]
+            _access_stats.clear()
+        for name in usage_files:
+            usage_df = _read_frame(USAGE_DIR / name)
+            if usage_df is not None:
+                usage_frames.append(usage_df)
+
+        rows = _with_cache_key(
+            _merge_frames(frames).filter(pl.col("search_term").is_not_null())
+        )
+        usage = (
+            pl.concat(
+                [
+                    rows.select(
+                        "_key",
+                        pl.col("hit_count").fill_null(0),
+                        pl.col("last_access").fill_null(pl.col("timestamp")),
+                    ),
+                    *usage_frames,
+                ],
+                how="vertical_relaxed",
+            )
+            .group_by("_key")
+            .agg(pl.col("hit_count").sum(), pl.col("last_access").max())
+        )
+        latest = (
+            rows.sort("timestamp", nulls_last=False)
+            .unique(subset="_key", keep="last")
+            .drop("hit_count", "last_access")
+            .join(usage, on="_key", how="left")
+            .filter(~_expired_expr())
+        )
+        compacted = _evict(latest).sort("_key").select(list(CACHE_SCHEMA))
+
+        # replace the base file atomically, then drop the merged segments
+        _atomic_write_parquet(compacted, CACHE_FILE)
+
+        for name in segments:
+            with contextlib.suppress(FileNotFoundError):
+                (SEGMENT_DIR / name).unlink()
+        for name in usage_files:
+            with contextlib.suppress(FileNotFoundError):
+                (USAGE_DIR / name).unlink()
+
+        return len(segments)
+
+
+def maybe_compact_cache():
+    """
+    Start a background compaction if enough segments have piled up.
+
+    Compaction rewrites the base file, so it waits until the pending
+    segments are a set share of the base file's size. Each byte in the
+    base file is then rewritten a bounded number of times per byte of new
+    writes, however large the cache grows.
+    """
+    global _compaction_thread
+
+    # usage files are segments too, and need compacting just the same
+    paths = [SEGMENT_DIR / name for name in _list_segments()]
+    paths += [USAGE_DIR / name for name in _list_segments(USAGE_DIR)]
+    if len(paths) < COMPACTION_MIN_SEGMENTS:
+        return
+    if len(paths) < COMPACTION_MAX_SEGMENTS:
+        pending = sum(_file_size(path) for path in paths)
+        if pending < COMPACTION_SIZE_RATIO * _file_size(CACHE_FILE):
+            return
+
+    with _compaction_thread_lock:
+        if _compaction_thread is not None and _compaction_thread.is_alive():
+            return
+        _compaction_thread = threading.Thread(
+            target=compact_cache, name="cache-compaction", daemon=True
+        )
+        _compaction_thread.start()
+
+
+def clear_cache():
+    """
+    Clear the local cache tiers, including the negative cache.
+
+    The shared tier is left alone, since other replicas rely on it.
+    """
+    global _cache_index, _cache_index_loaded
+    global _cache_index_mtime, _cache_index_segments, _access_hits
+
+    with _compaction_lock, _file_lock(exclusive=True):
+        for name in _list_segments():
+            with contextlib.suppress(FileNotFoundError):
+                (SEGMENT_DIR / name).unlink()
+        for name in _list_segments(USAGE_DIR):
+            with contextlib.suppress(FileNotFoundError):
+                (USAGE_DIR / name).unlink()
+
+        _atomic_write_parquet(_empty_cache(), CACHE_FILE)
+
+    with _cache_index_lock:
+        _cache_index = {}
+        _cache_index_loaded = True
+        _cache_index_mtime = _cache_file_mtime()
+        _cache_index_segments = set()
+
+    with _access_lock:
+        _access_stats.clear()
+        _access_hits = 0
+    _memory_cache.clear()
+
+    clear_negative_cache()
 
 
 def get_cache_stats() -> dict[str, Any]:
@@ -174,7 +1288,9 @@ def get_cache_stats() -> dict[str, Any]:
             source_counts[row["source"]] = row["count"]
 
     # recent searches
-    recent = cache_df.sort("timestamp", descending=True).limit(10)
+    recent = cache_df.sort(
+        "timestamp", descending=True, nulls_last=True
+    ).limit(10)
     recent_list = recent.select(
         "search_term", "source", "timestamp"
     ).to_dicts()
@@ -184,3 +1300,126 @@ def get_cache_stats() -> dict[str, Any]:
         "recent": recent_list,
         "sources": source_counts,
     }
+
+
+# negative cache table; expired entries are purged every 100 writes
+_negative_store = SQLiteStore(
+    [
+        "CREATE TABLE IF NOT EXISTS negative ("
+        "term_key TEXT NOT NULL, "
+        "source TEXT NOT NULL, "
+        "outcome TEXT NOT NULL, "
+        "recorded_at REAL NOT NULL, "
+        "PRIMARY KEY (term_key, source))"
+    ],
+    maintenance_interval=100,
+)
+
+
+def _negative_connect() -> sqlite3.Connection:
+    """
+    Get this thread's connection to the negative cache.
+
+    Returns
+    -------
+    sqlite3.Connection
+        Open connection.
+    """
+    return _negative_store.connect(NEGATIVE_CACHE_FILE)
+
+
+def lookup_negative(search_term: str, source: str) -> str | None:
+    """
+    Check whether a source recently had no answer for a search term.
+
+    Parameters
+    ----------
+    search_term : str
+        The taxonomic name.
+    source : str
+        Source name, e.g. "GBIF".
+
+    Returns
+    -------
+    Optional[str]
+        NO_MATCH or SOURCE_ERROR if recorded within its TTL, else None.
+    """
+    try:
+        row = (
+            _negative_connect()
+            .execute(
+                "SELECT outcome, recorded_at FROM negative "
+                "WHERE term_key = ? AND source = ?",
+                (_cache_key(search_term), source),
+            )
+            .fetchone()
+        )
+    except sqlite3.Error as e:
+        print(f"Negative cache error: {e}")
+        return None
+
+    if row is None:
+        return None
+    outcome, recorded_at = row
+    if time.time() - recorded_at >= NEGATIVE_TTLS.get(outcome, 0):
+        return None
+    return outcome
+
+
+def save_negative(search_term: str, source: str, outcome: str):
+    """
+    Record that a source had no match for, or failed on, a search term.
+
+    Parameters
+    ----------
+    search_term : str
+        The taxonomic name.
+    source : str
+        Source name, e.g. "GBIF".
+    outcome : str
+        NO_MATCH or SOURCE_ERROR.
+    """
+    try:
+        conn = _negative_connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO negative "
+            "(term_key, source, outcome, recorded_at) VALUES (?, ?, ?, ?)",
+            (_cache_key(search_term), source, outcome, time.time()),
+        )
+        conn.commit()
+
+        if _negative_store.count_writes():
+            _purge_negative(conn)
+    except sqlite3.Error as e:
+        print(f"Negative cache error: {e}")
+
+
+def _purge_negative(conn: sqlite3.Connection):
+    """
+    Delete negative cache entries older than their TTL.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Open connection.
+    """
+    now = time.time()
+    conn.executemany(
+        "DELETE FROM negative WHERE outcome = ? AND recorded_at < ?",
+        [(outcome, now - ttl) for outcome, ttl in NEGATIVE_TTLS.items()],
+    )
+    conn.commit()
+
+
+def clear_negative_cache():
+    """Remove every negative cache entry."""
+    try:
+        conn = _negative_connect()
+        conn.execute("DELETE FROM negative")
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"Negative cache error: {e}")
+
+
+# save pending hit counts when the interpreter exits
+atexit.register(flush_usage)
@@ -0,0 +1,67 @@
+"""
+Tests for the canonical forms of scientific names.
+"""
+
+import pytest
+
+from name_normalization import canonical_key, canonical_name
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        # case and spacing
+        ("Enchodus petrosus", "Enchodus petrosus"),
+        ("enchodus  petrosus", "Enchodus petrosus"),
+        ("ENCHODUS PETROSUS", "Enchodus petrosus"),
+        ("Tyrannosaurus Rex", "Tyrannosaurus rex"),
+        ("Enchodus Petrosus", "Enchodus petrosus"),
+        ("  Enchodus  ", "Enchodus"),
+        ("", ""),
+        # accents and full-width characters
+        ("Énchodus pétrosus", "Enchodus petrosus"),
+        ("Ｅｎｃｈｏｄｕｓ ｐｅｔｒｏｓｕｓ", "Enchodus petrosus"),
+        # subgenus
+        ("Enchodus (Enchodus) petrosus", "Enchodus petrosus"),
+        # qualifiers
+        ("Enchodus cf. petrosus", "Enchodus petrosus"),
+        ("Enchodus aff. petrosus", "Enchodus petrosus"),
+        ("Enchodus ? petrosus", "Enchodus petrosus"),
+        ("Enchodus cf petrosus", "Enchodus petrosus"),
+        ("Enchodus sp.", "Enchodus"),
+        ("Enchodus sp", "Enchodus"),
+        # epithets that look like qualifiers or contain digits
+        ("Xus aff Smith, 1900", "Xus aff"),
+        ("Xus 10-punctatus", "Xus 10-punctatus"),
+        ("Xus decemlineata2 Smith", "Xus decemlineata2"),
+        # subspecies and the epithet limit
+        ("Enchodus petrosus petrosus", "Enchodus petrosus petrosus"),
+        ("Aus bus cus dus", "Aus bus cus"),
+        # infraspecific rank markers
+        ("Aus bus subsp. cus", "Aus bus cus"),
+        ("Aus bus ssp. cus", "Aus bus cus"),
+        ("Aus bus var. cus", "Aus bus cus"),
+        ("Aus bus f. cus Smith, 1900", "Aus bus cus"),
+        # authorities
+        ("Enchodus petrosus Cope, 1874", "Enchodus petrosus"),
+        ("Enchodus petrosus Cope 1874", "Enchodus petrosus"),
+        ("Enchodus petrosus (Cope, 1874)", "Enchodus petrosus"),
+        ("Enchodus petrosus Cope", "Enchodus petrosus"),
+        ("Enchodus petrosus E. D. Cope", "Enchodus petrosus"),
+        ("Enchodus petrosus Cope & Smith, 1874", "Enchodus petrosus"),
+        ("Enchodus petrosus de Kay, 1842", "Enchodus petrosus"),
+        ("Enchodus Cope, 1874", "Enchodus"),
+        (
+            "enchodus  (Enchodus) petrosus Cope, 1874",
+            "Enchodus petrosus",
+        ),
+    ],
+)
+def test_canonical_name(name, expected):
+    assert canonical_name(name) == expected
+
+
+def test_canonical_key_is_lowercase_canonical_name():
+    assert canonical_key("Tyrannosaurus Rex Osborn, 1905") == (
+        "tyrannosaurus rex"
+    )